@@ -1,15 +1,22 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
+import asyncio
+import json
 import logging
 
+import redis.asyncio as aioredis
+
 from database.session import get_db
 from services.course_generation_service import CourseGenerationService
 from services.chapter_service import ChapterService
 from models.course import Course
 from models.chapter import Chapter
 from models.enums import CourseStatus, GenerationStatus
+from tasks.celery_app import celery_app
+from tasks.generation_tasks import get_task_status, progress_channel
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/courses", tags=["generation"])
@@ -315,3 +322,79 @@ async def restart_generation(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to restart generation"
         )
+
+# Real-time progress stream for a generation task
+_FINAL_TASK_STATUSES = frozenset({"completed", "failed", "revoked"})
+_STREAM_KEEPALIVE_SECONDS = 15.0
+
+# Shared by every stream in this process; connections are only opened on use
+_progress_redis = aioredis.from_url(celery_app.conf.result_backend)
+
+def _is_final_progress(event: Dict[str, Any]) -> bool:
+    """Whether a progress event is the last one a task will publish."""
+    return (
+        event.get("status") in _FINAL_TASK_STATUSES
+        or event.get("progress_percentage", 0.0) >= 100.0
+    )
+
+async def _progress_events(task_id: str) -> AsyncIterator[str]:
+    """Yield Server-Sent Events for a task from its Redis progress channel."""
+    pubsub = _progress_redis.pubsub()
+    try:
+        # Subscribe before taking the snapshot so no update falls in between
+        await pubsub.subscribe(progress_channel(task_id))
+        
+        snapshot = await asyncio.to_thread(get_task_status, task_id)
+        snapshot.pop("result", None)
+        started = snapshot.get("status") != "pending"
+        if started:
+            yield f"data: {json.dumps(snapshot, default=str)}\n\n"
+            if _is_final_progress(snapshot):
+                return
+        
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True,
+                timeout=_STREAM_KEEPALIVE_SECONDS
+            )
+            if message is not None:
+                started = True
+                data = message["data"].decode()
+                yield f"data: {data}\n\n"
+                if _is_final_progress(json.loads(data)):
+                    return
+                continue
+            
+            # Chord callback failures, revokes and expired results end a
+            # task without a progress update, so re-check the stored state
+            snapshot = await asyncio.to_thread(get_task_status, task_id)
+            snapshot.pop("result", None)
+            if _is_final_progress(snapshot):
+                yield f"data: {json.dumps(snapshot, default=str)}\n\n"
+                return
+            if snapshot.get("status") == "pending":
+                if started:
+                    # The stored result expired after the task had run
+                    return
+            else:
+                started = True
+            yield ": keepalive\n\n"
+    finally:
+        await pubsub.aclose()
+
+@router.get("/generation-tasks/{task_id}/events")
+async def stream_generation_progress(task_id: str) -> StreamingResponse:
+    """
+    Stream progress of a background generation task as Server-Sent Events.
+    
+    Sends the current status first, then every update published by the
+    worker, and closes once the task completes or fails. Clients that cannot
+    hold a connection open can keep polling the generation status instead.
+    """
+    logger.info(f"Streaming generation progress for task: {task_id}")
+    
+    return StreamingResponse(
+        _progress_events(task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
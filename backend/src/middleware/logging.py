@@ -3,22 +3,25 @@ Request/Response Logging Middleware for Course Generation Platform
 Provides structured logging with correlation IDs, performance metrics, and security features.
 """
 
+import base64
+import functools
 import json
 import logging
+import re
+import secrets
 import time
-import uuid
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, FrozenSet, Optional, Set
 from contextvars import ContextVar
-from urllib.parse import quote_plus
+from urllib.parse import parse_qsl, quote_plus
 
-from fastapi import Request, Response
-from fastapi.responses import StreamingResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+import orjson
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-# Context variables for correlation tracking
-request_id_context: ContextVar[str] = ContextVar('request_id', default='')
+# Context variables for correlation tracking; the request ID is kept as raw
+# bytes and rendered by get_correlation_id
+request_id_context: ContextVar[bytes] = ContextVar('request_id', default=b'')
 user_id_context: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
 
 # Sensitive data patterns to mask in logs
@@ -26,13 +29,36 @@ SENSITIVE_HEADERS: Set[str] = {
     'authorization', 'x-api-key', 'x-auth-token', 'cookie', 'set-cookie'
 }
 
-SENSITIVE_PARAMS: Set[str] = {
+SENSITIVE_PARAMS: FrozenSet[str] = frozenset({
     'password', 'token', 'secret', 'key', 'auth', 'credential'
-}
+})
 
-SENSITIVE_BODY_KEYS: Set[str] = {
+SENSITIVE_BODY_KEYS: FrozenSet[str] = frozenset({
     'password', 'token', 'secret_key', 'api_key', 'auth_token', 'credential'
-}
+})
+
+# Keys are masked when they contain any sensitive word; each set is folded
+# into one precompiled alternation so a key is scanned once per request
+# instead of once per word
+_SENSITIVE_PARAM_PATTERN = re.compile(
+    '|'.join(map(re.escape, sorted(SENSITIVE_PARAMS))), re.IGNORECASE
+)
+_SENSITIVE_BODY_KEY_PATTERN = re.compile(
+    '|'.join(map(re.escape, sorted(SENSITIVE_BODY_KEYS))), re.IGNORECASE
+)
+
+
+# Clients send the same few parameter and field names on every request, so
+# the verdict per name is memoized and repeat keys cost one hash lookup
+@functools.lru_cache(maxsize=1024)
+def _is_sensitive_param(key: str) -> bool:
+    return _SENSITIVE_PARAM_PATTERN.search(key) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_sensitive_body_key(key: str) -> bool:
+    return _SENSITIVE_BODY_KEY_PATTERN.search(key) is not None
+
 
 # Skip logging for certain paths to reduce noise
 SKIP_PATHS: Set[str] = {
@@ -43,6 +69,20 @@ SKIP_PATHS: Set[str] = {
 MAX_BODY_SIZE = 10000  # 10KB
 
 
+# Log records arriving within the same second share their date prefix, so it
+# is formatted once per second rather than once per record
+_timestamp_cache = [-1, '']
+
+
+def _format_timestamp(created: float, msecs: float) -> str:
+    """Format a record time like logging.Formatter.formatTime's default"""
+    second = int(created)
+    if second != _timestamp_cache[0]:
+        _timestamp_cache[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        _timestamp_cache[0] = second
+    return '%s,%03d' % (_timestamp_cache[1], msecs)
+
+
 class StructuredLogger:
     """Structured JSON logger for HTTP requests and responses"""
     
@@ -61,11 +101,15 @@ class StructuredLogger:
         class JsonFormatter(logging.Formatter):
             def format(self, record):
                 log_data = {
-                    'timestamp': self.formatTime(record, self.datefmt),
+                    'timestamp': (
+                        _format_timestamp(record.created, record.msecs)
+                        if self.datefmt is None
+                        else self.formatTime(record, self.datefmt)
+                    ),
                     'level': record.levelname,
                     'logger': record.name,
                     'message': record.getMessage(),
-                    'request_id': request_id_context.get(''),
+                    'request_id': get_correlation_id(),
                     'user_id': user_id_context.get(None),
                 }
                 
@@ -78,7 +122,15 @@ class StructuredLogger:
                                  'exc_info', 'exc_text', 'stack_info', 'getMessage']:
                         log_data[key] = value
                 
-                return json.dumps(log_data, default=str, ensure_ascii=False)
+                try:
+                    return orjson.dumps(
+                        log_data,
+                        default=str,
+                        option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+                    ).decode('utf-8')
+                except orjson.JSONEncodeError:
+                    # Integers past 64 bits and similar edge cases
+                    return json.dumps(log_data, default=str, ensure_ascii=False)
         
         return JsonFormatter()
     
@@ -95,9 +147,34 @@ class StructuredLogger:
         self.logger.error("HTTP Error", extra=kwargs)
 
 
-class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
+class _BodyCapture:
+    """Copies at most ``limit`` bytes of a streamed body while counting its full size"""
+    
+    __slots__ = ('limit', 'data', 'size')
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.data = bytearray()
+        self.size = 0
+    
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.size += len(chunk)
+        if self.size > self.limit:
+            # Too large to log; only the size is kept from here on
+            self.data.clear()
+        else:
+            self.data += chunk
+    
+    @property
+    def too_large(self) -> bool:
+        return self.size > self.limit
+
+
+class RequestResponseLoggingMiddleware:
     """
-    FastAPI middleware for comprehensive request/response logging
+    ASGI middleware for comprehensive request/response logging
     
     Features:
     - Correlation ID generation and tracking
@@ -106,6 +183,10 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
     - Structured JSON logging
     - Error tracking and correlation
     - Request/response body logging (with size limits)
+    
+    Bodies are copied from the ASGI messages as they pass through to the
+    app and the client, so nothing is re-buffered and streaming responses
+    keep streaming; at most ``max_body_size`` bytes are held per body.
     """
     
     def __init__(
@@ -118,23 +199,26 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
         log_response_body: bool = True,
         logger_name: str = "course_platform.middleware.logging"
     ):
-        super().__init__(app)
+        self.app = app
         self.skip_paths = skip_paths or SKIP_PATHS
         self.max_body_size = max_body_size
         self.log_request_body = log_request_body
         self.log_response_body = log_response_body
         self.logger = StructuredLogger(logger_name)
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """Main middleware dispatch method"""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Main middleware entry point"""
+        
+        # Skip logging for non-HTTP traffic and certain paths
+        if scope['type'] != 'http' or scope['path'] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
         
-        # Skip logging for certain paths
-        if request.url.path in self.skip_paths:
-            return await call_next(request)
+        request = Request(scope)
         
         # Generate correlation ID
-        correlation_id = str(uuid.uuid4())
-        request_id_context.set(correlation_id)
+        request_id_context.set(secrets.token_bytes(16))
+        correlation_id = get_correlation_id()
         
         # Extract user ID from auth header if available
         user_id = self._extract_user_id(request)
@@ -143,26 +227,64 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
         # Start timing
         start_time = time.time()
         
-        # Read and log request
-        request_data = await self._prepare_request_data(request, correlation_id, user_id)
-        self.logger.log_request(**request_data)
+        request_data = self._prepare_request_data(request, correlation_id, user_id)
+        capture_request_body = (
+            self.log_request_body and request.method in ['POST', 'PUT', 'PATCH']
+        )
+        request_body = _BodyCapture(self.max_body_size)
+        response_body = _BodyCapture(self.max_body_size if self.log_response_body else 0)
+        response_start: Message = {}
+        request_logged = False
+        
+        def log_request() -> None:
+            nonlocal request_logged
+            if request_logged:
+                return
+            request_logged = True
+            if capture_request_body:
+                body = self._format_request_body(request, request_body)
+                if body:
+                    request_data['request_body'] = body
+                    request_data['request_body_size'] = len(str(body))
+            self.logger.log_request(**request_data)
+        
+        if capture_request_body:
+            async def receive_wrapper() -> Message:
+                message = await receive()
+                if message['type'] == 'http.request':
+                    request_body.feed(message.get('body', b''))
+                    # Logged once the app has read the whole body
+                    if not message.get('more_body', False):
+                        log_request()
+                return message
+        else:
+            log_request()
+            receive_wrapper = receive
+        
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                # The app may answer without reading the request body
+                log_request()
+                response_start.update(message)
+                await send(message)
+            elif message['type'] == 'http.response.body':
+                response_body.feed(message.get('body', b''))
+                await send(message)
+                if not message.get('more_body', False):
+                    duration_ms = round((time.time() - start_time) * 1000, 2)
+                    response_data = self._prepare_response_data(
+                        request, response_start, response_body,
+                        correlation_id, user_id, duration_ms
+                    )
+                    self.logger.log_response(**response_data)
+            else:
+                await send(message)
         
-        # Process request and handle response
         try:
-            response = await call_next(request)
-            
-            # Calculate timing
-            duration_ms = round((time.time() - start_time) * 1000, 2)
-            
-            # Log response
-            response_data = await self._prepare_response_data(
-                request, response, correlation_id, user_id, duration_ms
-            )
-            self.logger.log_response(**response_data)
-            
-            return response
-            
+            await self.app(scope, receive_wrapper, send_wrapper)
         except Exception as exc:
+            log_request()
+            
             # Calculate timing for error case
             duration_ms = round((time.time() - start_time) * 1000, 2)
             
@@ -204,16 +326,16 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
         
         return None
     
-    async def _prepare_request_data(
+    def _prepare_request_data(
         self, 
         request: Request, 
         correlation_id: str, 
         user_id: Optional[str]
     ) -> Dict[str, Any]:
-        """Prepare request data for logging"""
+        """Prepare request data for logging; the body is added once read"""
         
         # Basic request information
-        data = {
+        return {
             'event_type': 'http_request',
             'correlation_id': correlation_id,
             'user_id': user_id,
@@ -226,113 +348,103 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
             'content_type': request.headers.get('content-type', ''),
             'content_length': request.headers.get('content-length', 0)
         }
-        
-        # Add request body if enabled and appropriate
-        if self.log_request_body and request.method in ['POST', 'PUT', 'PATCH']:
-            body = await self._get_request_body(request)
-            if body:
-                data['request_body'] = body
-                data['request_body_size'] = len(str(body))
-        
-        return data
     
-    async def _prepare_response_data(
+    def _prepare_response_data(
         self,
         request: Request,
-        response: Response,
+        response_start: Message,
+        response_body: _BodyCapture,
         correlation_id: str,
         user_id: Optional[str],
         duration_ms: float
     ) -> Dict[str, Any]:
         """Prepare response data for logging"""
         
+        headers = {
+            key.decode('latin-1'): value.decode('latin-1')
+            for key, value in response_start.get('headers', [])
+        }
         data = {
             'event_type': 'http_response',
             'correlation_id': correlation_id,
             'user_id': user_id,
             'method': request.method,
             'path': request.url.path,
-            'status_code': response.status_code,
+            'status_code': response_start.get('status'),
             'duration_ms': duration_ms,
-            'response_headers': self._mask_sensitive_headers(dict(response.headers)),
+            'response_headers': self._mask_sensitive_headers(headers),
         }
         
         # Add response size if available
-        content_length = response.headers.get('content-length')
+        content_length = headers.get('content-length')
         if content_length:
             data['response_size'] = int(content_length)
         
-        # Add response body if enabled and not a streaming response
-        if (self.log_response_body and 
-            not isinstance(response, StreamingResponse) and
-            hasattr(response, 'body')):
-            
-            body = await self._get_response_body(response)
+        # Add response body if enabled
+        if self.log_response_body:
+            body = self._format_response_body(response_body)
             if body:
                 data['response_body'] = body
                 data['response_body_size'] = len(str(body))
         
         return data
     
-    async def _get_request_body(self, request: Request) -> Optional[Any]:
-        """Safely extract and mask request body"""
+    def _format_request_body(self, request: Request, body: _BodyCapture) -> Optional[Any]:
+        """Safely decode and mask the captured request body"""
+        if not body.size:
+            return None
+        
         try:
             # Check content type
             content_type = request.headers.get('content-type', '').lower()
             
             if 'application/json' in content_type:
-                body = await request.body()
-                if len(body) > self.max_body_size:
-                    return f"[Body too large: {len(body)} bytes]"
+                if body.too_large:
+                    return f"[Body too large: {body.size} bytes]"
                 
                 try:
-                    json_body = json.loads(body)
+                    json_body = orjson.loads(body.data)
                     return self._mask_sensitive_json(json_body)
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     return "[Invalid JSON]"
             
             elif 'application/x-www-form-urlencoded' in content_type:
-                form = await request.form()
+                if body.too_large:
+                    return f"[Body too large: {body.size} bytes]"
+                form = parse_qsl(body.data.decode('utf-8', errors='replace'), keep_blank_values=True)
                 return self._mask_sensitive_params(dict(form))
             
             elif content_type.startswith('text/'):
-                body = await request.body()
-                if len(body) > self.max_body_size:
-                    return f"[Body too large: {len(body)} bytes]"
-                return body.decode('utf-8', errors='replace')
+                if body.too_large:
+                    return f"[Body too large: {body.size} bytes]"
+                return body.data.decode('utf-8', errors='replace')
             
             else:
                 # For other content types, just log the size
-                body = await request.body()
-                return f"[Binary content: {len(body)} bytes]"
+                return f"[Binary content: {body.size} bytes]"
                 
         except Exception as e:
             return f"[Error reading body: {str(e)}]"
     
-    async def _get_response_body(self, response: Response) -> Optional[Any]:
-        """Safely extract response body"""
+    def _format_response_body(self, body: _BodyCapture) -> Optional[Any]:
+        """Safely decode and mask the captured response body"""
+        if not body.size:
+            return None
+        
+        if body.too_large:
+            return f"[Body too large: {body.size} bytes]"
+        
         try:
-            if hasattr(response, 'body') and response.body:
-                body = response.body
-                
-                if len(body) > self.max_body_size:
-                    return f"[Body too large: {len(body)} bytes]"
-                
-                # Try to decode as JSON first
-                try:
-                    json_body = json.loads(body)
-                    return self._mask_sensitive_json(json_body)
-                except (json.JSONDecodeError, TypeError):
-                    # If not JSON, try as text
-                    try:
-                        return body.decode('utf-8', errors='replace')
-                    except (UnicodeDecodeError, AttributeError):
-                        return f"[Binary content: {len(body)} bytes]"
+            # Try to decode as JSON first
+            try:
+                json_body = orjson.loads(body.data)
+                return self._mask_sensitive_json(json_body)
+            except orjson.JSONDecodeError:
+                # If not JSON, log it as text
+                return body.data.decode('utf-8', errors='replace')
             
         except Exception as e:
             return f"[Error reading response body: {str(e)}]"
-        
-        return None
     
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP from request headers"""
@@ -365,7 +477,7 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
         """Mask sensitive query parameters"""
         masked = {}
         for key, value in params.items():
-            if any(sensitive in key.lower() for sensitive in SENSITIVE_PARAMS):
+            if _is_sensitive_param(key):
                 masked[key] = '[MASKED]'
             else:
                 masked[key] = value
@@ -376,7 +488,7 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
         if isinstance(data, dict):
             masked = {}
             for key, value in data.items():
-                if any(sensitive in key.lower() for sensitive in SENSITIVE_BODY_KEYS):
+                if _is_sensitive_body_key(key):
                     masked[key] = '[MASKED]'
                 else:
                     masked[key] = self._mask_sensitive_json(value)
@@ -387,9 +499,14 @@ class RequestResponseLoggingMiddleware(BaseHTTPMiddleware):
             return data
 
 
+@functools.lru_cache(maxsize=256)
+def _render_correlation_id(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
 def get_correlation_id() -> str:
-    """Get the current request correlation ID"""
-    return request_id_context.get('')
+    """Get the current request correlation ID (22 URL-safe base64 characters)"""
+    return _render_correlation_id(request_id_context.get(b''))
 
 
 def get_user_id() -> Optional[str]:
@@ -11,12 +11,16 @@ Features:
 - Performance optimized with Lua scripts for atomic operations
 """
 
+import re
 import time
 import redis
 import json
 import hashlib
 import asyncio
-from typing import Dict, Optional, List, Tuple, Union
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, List, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 from fastapi import HTTPException, status, Request, Depends
@@ -120,11 +124,21 @@ class EndpointClassifier:
         ]
     }
     
+    # Resource ids never affect the classification, so they are collapsed
+    # before caching to keep one entry per route rather than per resource
+    _RESOURCE_ID_PATTERN = re.compile(
+        r"/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}(?=/|$)",
+        re.IGNORECASE
+    )
+    
     @classmethod
     def classify_endpoint(cls, method: str, path: str) -> RateLimitType:
         """Classify an endpoint to determine its rate limit type"""
-        import re
-        
+        return cls._classify(method, cls._RESOURCE_ID_PATTERN.sub("/:id", path))
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _classify(cls, method: str, path: str) -> RateLimitType:
         endpoint_key = f"{method}:{path}"
         
         for limit_type, patterns in cls.ENDPOINT_PATTERNS.items():
@@ -134,12 +148,56 @@ class EndpointClassifier:
         
         return RateLimitType.STANDARD
 
+class _TimestampRing:
+    """Request timestamps for one memory-store window, oldest first
+    
+    The timestamps live in a ring of 64-bit slots instead of a list of int
+    objects. It starts small and doubles, up to the window's limit, only
+    when full, so memory follows the requests made rather than the limit.
+    """
+    
+    INITIAL_SLOTS = 8
+    
+    __slots__ = ("slots", "head", "size")
+    
+    def __init__(self):
+        self.slots = array("q", bytes(8 * self.INITIAL_SLOTS))
+        self.head = 0
+        self.size = 0
+    
+    def expire(self, window_start: int) -> None:
+        """Drop timestamps at or before window_start"""
+        slots = self.slots
+        while self.size and slots[self.head] <= window_start:
+            self.head = (self.head + 1) % len(slots)
+            self.size -= 1
+    
+    def append(self, timestamp: int, capacity: int) -> None:
+        """Add the newest timestamp; callers only append below capacity"""
+        if self.size == len(self.slots):
+            grown = min(2 * len(self.slots), capacity)
+            self.slots = array("q", self) + array("q", bytes(8 * (grown - self.size)))
+            self.head = 0
+        self.slots[(self.head + self.size) % len(self.slots)] = timestamp
+        self.size += 1
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self) -> Iterator[int]:
+        slots = self.slots
+        for offset in range(self.size):
+            yield slots[(self.head + offset) % len(slots)]
+
 class RateLimitStore:
     """Redis-based rate limit storage with memory fallback"""
     
     def __init__(self):
         self.redis_client = None
-        self._memory_store: Dict[str, Dict] = {}
+        self._sliding_window = None
+        # Request timestamps per identifier, oldest first. Checks run on the
+        # event loop without awaiting in between, so no lock is needed
+        self._memory_store: Dict[str, _TimestampRing] = {}
         self._setup_redis()
     
     def _setup_redis(self):
@@ -155,6 +213,11 @@ class RateLimitStore:
             )
             # Test connection
             self.redis_client.ping()
+            # Checks run the script by SHA (EVALSHA); the source is only
+            # re-sent if the server has flushed its script cache
+            self._sliding_window = self.redis_client.register_script(
+                self._lua_sliding_window_script()
+            )
             logger.info("Rate limiter connected to Redis successfully")
         except Exception as e:
             logger.warning(f"Redis connection failed, using memory fallback: {e}")
@@ -198,14 +261,9 @@ class RateLimitStore:
         
         if self.redis_client:
             try:
-                lua_script = self._lua_sliding_window_script()
-                result = self.redis_client.eval(
-                    lua_script, 
-                    1, 
-                    identifier, 
-                    window_seconds, 
-                    limit, 
-                    current_time
+                result = self._sliding_window(
+                    keys=[identifier],
+                    args=[window_seconds, limit, current_time]
                 )
                 return bool(result[0]), result[1], result[2]
             except Exception as e:
@@ -227,22 +285,18 @@ class RateLimitStore:
         current_time: int
     ) -> Tuple[bool, int, int]:
         """Memory-based rate limiting fallback"""
-        if identifier not in self._memory_store:
-            self._memory_store[identifier] = {"requests": []}
+        requests = self._memory_store.get(identifier)
+        if requests is None:
+            requests = self._memory_store[identifier] = _TimestampRing()
         
-        data = self._memory_store[identifier]
-        window_start = current_time - window_seconds
+        # Remove expired requests; timestamps are appended in order, so
+        # they all sit at the front
+        requests.expire(current_time - window_seconds)
         
-        # Remove expired requests
-        data["requests"] = [
-            req_time for req_time in data["requests"] 
-            if req_time > window_start
-        ]
-        
-        current_count = len(data["requests"])
+        current_count = len(requests)
         
         if current_count < limit:
-            data["requests"].append(current_time)
+            requests.append(current_time, limit)
             return True, current_count + 1, limit
         else:
             return False, current_count, limit
@@ -264,14 +318,19 @@ class RateLimitStore:
                 pass
         
         # Memory fallback
-        return {identifier: self._memory_store.get(identifier, {})}
+        requests = self._memory_store.get(identifier)
+        return {identifier: {"requests": list(requests)} if requests is not None else {}}
 
 class AdvancedRateLimiter:
     """Advanced rate limiting middleware with multiple time windows"""
     
+    # Decoded user info kept per bearer token, least recently used first out
+    JWT_CACHE_SIZE = 8192
+    
     def __init__(self):
         self.store = RateLimitStore()
         self.auth_middleware = AuthMiddleware()
+        self._jwt_cache: "OrderedDict[bytes, Tuple[Dict, Optional[float]]]" = OrderedDict()
     
     def _get_user_info(self, request: Request) -> Dict:
         """Extract user information from request"""
@@ -280,6 +339,18 @@ class AdvancedRateLimiter:
             auth_header = request.headers.get("authorization")
             if auth_header and auth_header.startswith("Bearer "):
                 token = auth_header.split(" ")[1]
+                
+                # The same token arrives on every request of a session, so
+                # the decode result is cached under a hash of the raw token
+                token_hash = hashlib.blake2b(token.encode(), digest_size=16).digest()
+                cached = self._jwt_cache.get(token_hash)
+                if cached is not None:
+                    user_info, expires_at = cached
+                    if expires_at is None or time.time() <= expires_at:
+                        self._jwt_cache.move_to_end(token_hash)
+                        return user_info
+                    del self._jwt_cache[token_hash]
+                
                 # Simplified token decode for user info
                 # In production, use proper JWT validation
                 import jwt
@@ -290,12 +361,18 @@ class AdvancedRateLimiter:
                         algorithms=["HS256"],
                         options={"verify_exp": False}  # For demo purposes
                     )
-                    return {
+                    user_info = {
                         "user_id": payload.get("sub"),
                         "role": payload.get("role", "user"),
                         "is_authenticated": True,
                         "is_premium": payload.get("is_premium", False)
                     }
+                    expires_at = payload.get("exp")
+                    if expires_at is None or time.time() <= expires_at:
+                        self._jwt_cache[token_hash] = (user_info, expires_at)
+                        if len(self._jwt_cache) > self.JWT_CACHE_SIZE:
+                            self._jwt_cache.popitem(last=False)
+                    return user_info
                 except:
                     pass
             
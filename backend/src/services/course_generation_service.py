@@ -1005,7 +1005,7 @@ class CourseGenerationService:
         try:
             # Start background task
             task = generate_course_task.delay(
-                course_data=request.course_data.dict(),
+                course_data=request.course_data.model_dump(mode="json"),
                 user_preferences=request.user_preferences
             )
             
@@ -1019,7 +1019,9 @@ class CourseGenerationService:
     async def get_generation_progress(self, task_id: str) -> GenerationProgress:
         """Get generation progress for a task."""
         try:
-            status = get_task_status.delay(task_id).get()
+            # Read the result backend directly: enqueueing the lookup cost a
+            # broker round trip, a worker slot and a stored result per poll
+            status = await asyncio.to_thread(get_task_status, task_id)
             
             return GenerationProgress(
                 course_id=UUID(status.get("course_id", str(uuid4()))),
@@ -10,6 +10,7 @@ from .generation_tasks import (
     export_course_task,
     generate_chapter_task,
     generate_course_task,
+    load_course_result,
     regenerate_chapter_task,
     validate_quality_task,
 )
@@ -22,5 +23,6 @@ __all__ = [
     "validate_quality_task",
     "export_course_task",
     "regenerate_chapter_task",
+    "load_course_result",
     "task_manager",
 ]
\ No newline at end of file
@@ -9,7 +9,8 @@ import os
 from typing import Dict, Any
 
 from celery import Celery
-from kombu import Queue
+
+from .config import CeleryConfig, SecurityConfig, get_redis_socket_options, get_task_queues
 
 
 def create_celery_app() -> Celery:
@@ -30,44 +31,47 @@ def create_celery_app() -> Celery:
         broker_url=redis_url,
         result_backend=redis_url,
         
-        # Task routing
-        task_routes={
-            "src.tasks.generation_tasks.generate_course_task": {"queue": "course_generation"},
-            "src.tasks.generation_tasks.generate_chapter_task": {"queue": "chapter_generation"},
-            "src.tasks.generation_tasks.validate_quality_task": {"queue": "quality_validation"},
-            "src.tasks.generation_tasks.export_course_task": {"queue": "export"},
-            "src.tasks.generation_tasks.regenerate_chapter_task": {"queue": "chapter_generation"},
+        # Task routing and priorities (shared with the worker configuration so
+        # producers and consumers agree on priority queue names)
+        task_routes=CeleryConfig.task_routes,
+        task_queue_max_priority=CeleryConfig.task_queue_max_priority,
+        task_default_priority=CeleryConfig.task_default_priority,
+        broker_transport_options={
+            **CeleryConfig.broker_transport_options,
+            **get_redis_socket_options(),
         },
         
         # Queue definitions
-        task_default_queue="default",
-        task_queues=(
-            Queue("course_generation", routing_key="course_generation"),
-            Queue("chapter_generation", routing_key="chapter_generation"),
-            Queue("quality_validation", routing_key="quality_validation"),
-            Queue("export", routing_key="export"),
-            Queue("default", routing_key="default"),
-        ),
+        task_default_queue=CeleryConfig.task_default_queue,
+        task_queues=get_task_queues(),
         
         # Concurrency and performance
-        worker_concurrency=4,  # Adjustable based on system resources
-        worker_prefetch_multiplier=1,  # Prevent overloading workers
-        task_acks_late=True,  # Acknowledge after completion
+        worker_concurrency=CeleryConfig.worker_concurrency,
+        worker_prefetch_multiplier=CeleryConfig.worker_prefetch_multiplier,
+        task_acks_late=CeleryConfig.task_acks_late,  # Acknowledge after completion
+        task_reject_on_worker_lost=CeleryConfig.task_reject_on_worker_lost,
         worker_disable_rate_limits=False,
         
         # Retry configuration
         task_retry_jitter=True,
         task_retry_jitter_max=5.0,
-        task_default_retry_delay=60,  # 1 minute default retry delay
+        task_default_retry_delay=CeleryConfig.task_default_retry_delay,
         task_max_retries=3,
         
         # Result backend settings
-        result_expires=3600 * 24,  # 24 hours
-        result_compression="gzip",
+        result_expires=CeleryConfig.result_expires,
+        result_backend_always_retry=CeleryConfig.result_backend_always_retry,
+        
+        # One long-lived pool per process for progress writes, sized for the
+        # task pool so updates never wait on (or reconnect for) a connection
+        redis_max_connections=CeleryConfig.redis_max_connections,
+        redis_backend_health_check_interval=CeleryConfig.redis_backend_health_check_interval,
+        redis_retry_on_timeout=CeleryConfig.redis_retry_on_timeout,
+        redis_socket_keepalive=SecurityConfig.REDIS_SOCKET_KEEPALIVE,
         
         # Monitoring and logging
-        worker_send_task_events=True,
-        task_send_sent_event=True,
+        worker_send_task_events=CeleryConfig.worker_send_task_events,
+        task_send_sent_event=CeleryConfig.task_send_sent_event,
         task_track_started=True,
         
         # Task time limits (2min for chapters as per requirements)
@@ -75,17 +79,17 @@ def create_celery_app() -> Celery:
         task_time_limit=120,  # 2:00 hard limit for chapters
         
         # Serialization
-        task_serializer="json",
-        result_serializer="json",
-        accept_content=["json"],
+        task_serializer=CeleryConfig.task_serializer,
+        result_serializer=CeleryConfig.result_serializer,
+        accept_content=CeleryConfig.accept_content,
         
         # Security
         worker_hijack_root_logger=False,
         worker_log_color=False,
         
         # Performance tuning for 100+ concurrent courses
-        broker_pool_limit=50,
-        broker_connection_retry_on_startup=True,
+        broker_pool_limit=CeleryConfig.broker_pool_limit,
+        broker_connection_retry_on_startup=CeleryConfig.broker_connection_retry_on_startup,
         broker_connection_retry=True,
         broker_connection_max_retries=10,
         
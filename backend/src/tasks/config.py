@@ -5,16 +5,121 @@ Provides environment-specific configuration for Celery workers,
 monitoring, and performance optimization.
 """
 
+import functools
 import os
-from typing import Dict, Any, List
+import socket
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import orjson
+import zstandard
+from kombu import Exchange, Queue
+from kombu.serialization import register
+
+# zstd frame magic number; JSON documents never start with these bytes
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Smaller payloads (PENDING/RETRY stubs) gain nothing from compression
+_ZSTD_MIN_SIZE = 128
+_ZSTD_LEVEL = 3
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """Encode task results, writing naive datetimes as UTC ISO strings."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC)
+
+
+def _orjson_zstd_dumps(obj: Any) -> bytes:
+    """Encode task results as orjson, zstd-compressed unless tiny."""
+    data = _orjson_dumps(obj)
+    if len(data) < _ZSTD_MIN_SIZE:
+        return data
+    return zstandard.compress(data, _ZSTD_LEVEL)
+
+
+def _orjson_zstd_loads(data: bytes) -> Any:
+    """Decode results written by either the orjson or orjson-zstd codec."""
+    if data[:4] == _ZSTD_MAGIC:
+        data = zstandard.decompress(data)
+    return orjson.loads(data)
+
+
+# Registered at import so API producers and workers share the codecs
+register(
+    "orjson",
+    _orjson_dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+register(
+    "orjson-zstd",
+    _orjson_zstd_dumps,
+    _orjson_zstd_loads,
+    content_type="application/x-orjson-zstd",
+    content_encoding="binary",
+)
+
+
+@functools.cache
+def _env_str(name: str, default: str) -> str:
+    """Read a string environment setting once per process."""
+    return os.environ.get(name, default)
+
+
+@functools.cache
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment setting once per process."""
+    return int(os.environ.get(name, default))
+
+
+# Queue routing table: user-requested regenerations jump ahead of bulk
+# chapter generation on the shared chapter_generation queue
+_ROUTE_TABLE: Dict[str, Dict[str, Any]] = {
+    "src.tasks.generation_tasks.generate_course_task": {"queue": "course_generation"},
+    "src.tasks.generation_tasks.assemble_course_task": {"queue": "course_generation"},
+    "src.tasks.generation_tasks.generate_chapter_task": {
+        "queue": "chapter_generation",
+        "priority": 5,
+    },
+    "src.tasks.generation_tasks.validate_quality_task": {"queue": "quality_validation"},
+    "src.tasks.generation_tasks.export_course_task": {"queue": "export"},
+    "src.tasks.generation_tasks.regenerate_chapter_task": {
+        "queue": "chapter_generation",
+        "priority": 0,
+    },
+}
+
+
+def _route_task(name, args, kwargs, options, task=None, **kw):
+    """Celery router resolving a task name with a single table lookup."""
+    return _ROUTE_TABLE.get(name)
 
 
 class CeleryConfig:
     """Celery configuration class."""
     
-    # Redis configuration
-    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    # Settings are read from the class; instances carry no __dict__
+    __slots__ = ()
+    
+    # Worker pool: gevent runs many cooperative greenlets per process for
+    # network-bound LLM calls; prefork stays the default for CPU-heavy work
+    GEVENT_CONCURRENCY = 200
+    worker_pool = _env_str("CELERY_POOL", "prefork")
+    
+    # Worker pool size (also sizes the Redis connection pools)
+    worker_concurrency = _env_int(
+        "CELERY_WORKER_CONCURRENCY",
+        GEVENT_CONCURRENCY if worker_pool == "gevent" else 4,
+    )
+    
+    # Redis configuration: two connections per worker process plus headroom
+    REDIS_URL = _env_str("REDIS_URL", "redis://localhost:6379/0")
+    REDIS_MAX_CONNECTIONS = _env_int("REDIS_MAX_CONNECTIONS", worker_concurrency * 2 + 4)
+    REDIS_HEALTH_CHECK_INTERVAL = 30
+    
+    # Complete courses are written here rather than into the result backend;
+    # must be shared between workers and the API (e.g. a mounted volume)
+    COURSE_RESULTS_DIR = _env_str("COURSE_RESULTS_DIR", "/tmp/course_results")
     
     # Broker settings
     broker_url = REDIS_URL
@@ -22,56 +127,152 @@ class CeleryConfig:
     broker_connection_retry_on_startup = True
     broker_connection_retry = True
     broker_connection_max_retries = 10
+    broker_transport_options = {
+        "max_connections": REDIS_MAX_CONNECTIONS,
+        "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+        "retry_on_timeout": True,
+        "polling_interval": 0.1,  # kombu default is 1s between empty polls
+        "visibility_timeout": 3600,  # > longest task time limit (11 min)
+        "priority_steps": list(range(10)),  # one Redis list per priority 0-9
+    }
     
-    # Result backend
+    # Result backend (the Redis backend reads its pool settings from redis_*)
     result_backend = REDIS_URL
-    result_expires = 3600 * 24  # 24 hours
-    result_compression = "gzip"
+    result_expires = _env_int("CELERY_RESULT_EXPIRES", 3600)  # 1 hour
+    result_backend_always_retry = True
     result_backend_max_retries = 10
+    result_backend_max_sleep_between_retries_ms = 10000
+    result_chord_join_timeout = 300.0
+    result_extended = False  # don't store task args/kwargs with results
+    redis_max_connections = REDIS_MAX_CONNECTIONS
+    redis_backend_health_check_interval = REDIS_HEALTH_CHECK_INTERVAL
+    redis_retry_on_timeout = True
     
-    # Task settings
-    task_serializer = "json"
-    result_serializer = "json"
-    accept_content = ["json"]
+    # Task settings: msgpack for task payloads (json stays accepted for
+    # messages published before the switch); results use orjson, which
+    # encodes the datetimes in progress meta natively, compressed with zstd.
+    # The Redis result backend ignores result_compression, so compression
+    # lives in the serializer; it still reads plain orjson results
+    task_serializer = "msgpack"
+    result_serializer = "orjson-zstd"
+    accept_content = ["msgpack", "orjson-zstd", "orjson", "json"]
     timezone = "UTC"
     enable_utc = True
     
     # Worker settings
-    worker_concurrency = int(os.getenv("CELERY_WORKER_CONCURRENCY", "4"))
-    worker_prefetch_multiplier = 1
-    worker_max_tasks_per_child = int(os.getenv("CELERY_MAX_TASKS_PER_CHILD", "1000"))
+    # Tasks run for two to ten minutes, so each worker slot reserves a single
+    # message: anything prefetched behind a long course generation would wait
+    # for it instead of going to an idle worker. Acks are late (see below),
+    # so a reserved message is redelivered if its worker dies
+    worker_prefetch_multiplier = _env_int("CELERY_PREFETCH_MULTIPLIER", 1)
+    # Recycle children on resident memory (KiB); the task count is only a
+    # backstop since task memory cost varies widely between task types
+    worker_max_memory_per_child = _env_int("CELERY_MAX_MEMORY_KB", 500 * 1024)
+    worker_max_tasks_per_child = _env_int("CELERY_MAX_TASKS_PER_CHILD", 5000)
     worker_disable_rate_limits = False
+    worker_enable_remote_control = True
+    # Late-acked tasks are redelivered when the broker connection drops, so
+    # stop the running copies instead of finishing them twice
+    worker_cancel_long_running_tasks_on_connection_loss = True
+    
+    # Per-queue pool overrides for dedicated workers (export keeps prefork
+    # for PDF rendering)
+    QUEUE_POOL_OVERRIDES = {
+        "chapter_generation": "gevent",
+        "quality_validation": "gevent",
+    }
+    
+    # Per-queue prefetch overrides for dedicated workers; these stay at 1
+    # even when CELERY_PREFETCH_MULTIPLIER raises the default
+    QUEUE_PREFETCH_OVERRIDES = {
+        "course_generation": 1,
+        "quality_validation": 1,
+        "export": 1,
+    }
     
     # Task execution
     task_acks_late = True
     task_reject_on_worker_lost = True
     task_track_started = True
-    task_send_sent_event = True
     
-    # Retry settings
+    # Retry settings: tasks should retry with exponential backoff and jitter
+    # (autoretry_for=..., retry_backoff=True, retry_backoff_max=600,
+    # retry_jitter=True) so failures during a provider outage spread out
+    # instead of retrying in lockstep; the default delay only applies to
+    # explicit self.retry() calls without a countdown
     task_retry_jitter = True
     task_retry_jitter_max = 5.0
-    task_default_retry_delay = 60
+    task_default_retry_delay = 10
     task_max_retries = 3
     
     # Time limits (performance requirement: <2min for chapters)
     task_soft_time_limit = 110  # 1:50 for chapters
     task_time_limit = 120  # 2:00 hard limit
     
-    # Monitoring
-    worker_send_task_events = True
-    task_send_sent_event = True
+    # Monitoring: task events cost extra broker publishes per task, so they
+    # are only sent when something (Flower) consumes them
+    worker_send_task_events = _env_str("CELERY_SEND_EVENTS", "false").lower() == "true"
+    task_send_sent_event = worker_send_task_events
     worker_hijack_root_logger = False
     worker_log_color = False
     
-    # Queue routing
-    task_routes = {
-        "src.tasks.generation_tasks.generate_course_task": {"queue": "course_generation"},
-        "src.tasks.generation_tasks.generate_chapter_task": {"queue": "chapter_generation"},
-        "src.tasks.generation_tasks.validate_quality_task": {"queue": "quality_validation"},
-        "src.tasks.generation_tasks.export_course_task": {"queue": "export"},
-        "src.tasks.generation_tasks.regenerate_chapter_task": {"queue": "chapter_generation"},
-    }
+    # Message priorities (Redis serves lower numbers first)
+    task_queue_max_priority = 10
+    task_default_priority = 5
+    
+    # Queue routing (see _route_task); unrouted tasks use the default queue
+    task_routes = (_route_task,)
+    task_default_queue = "default"
+    
+    # Celery settings exported by get_config (static, so no dir() scan needed)
+    _SETTINGS: ClassVar[Tuple[str, ...]] = (
+        "broker_url",
+        "broker_pool_limit",
+        "broker_connection_retry_on_startup",
+        "broker_connection_retry",
+        "broker_connection_max_retries",
+        "broker_transport_options",
+        "result_backend",
+        "result_expires",
+        "result_backend_always_retry",
+        "result_backend_max_retries",
+        "result_backend_max_sleep_between_retries_ms",
+        "result_chord_join_timeout",
+        "result_extended",
+        "redis_max_connections",
+        "redis_backend_health_check_interval",
+        "redis_retry_on_timeout",
+        "task_serializer",
+        "result_serializer",
+        "accept_content",
+        "timezone",
+        "enable_utc",
+        "worker_pool",
+        "worker_concurrency",
+        "worker_prefetch_multiplier",
+        "worker_max_memory_per_child",
+        "worker_max_tasks_per_child",
+        "worker_disable_rate_limits",
+        "worker_enable_remote_control",
+        "worker_cancel_long_running_tasks_on_connection_loss",
+        "task_acks_late",
+        "task_reject_on_worker_lost",
+        "task_track_started",
+        "task_send_sent_event",
+        "task_retry_jitter",
+        "task_retry_jitter_max",
+        "task_default_retry_delay",
+        "task_max_retries",
+        "task_soft_time_limit",
+        "task_time_limit",
+        "worker_send_task_events",
+        "worker_hijack_root_logger",
+        "worker_log_color",
+        "task_queue_max_priority",
+        "task_default_priority",
+        "task_routes",
+        "task_default_queue",
+    )
     
     # Environment-specific overrides
     @classmethod
@@ -87,29 +288,34 @@ class CeleryConfig:
         """
         env = environment or os.getenv("ENVIRONMENT", "development")
         
-        config = {
-            attr: getattr(cls, attr)
-            for attr in dir(cls)
-            if not attr.startswith("_") and not callable(getattr(cls, attr))
-        }
+        config = {attr: getattr(cls, attr) for attr in cls._SETTINGS}
         
         if env == "testing":
             # Testing configuration
-            config.update({
-                "task_always_eager": True,  # Execute tasks synchronously
-                "task_eager_propagates": True,
-                "task_store_eager_result": True,
-                "broker_url": "memory://",
-                "result_backend": "cache+memory://",
-            })
+            config.update(_TESTING_CONFIG)
         
         elif env == "production":
             # Production optimizations
+            concurrency = _env_int(
+                "CELERY_WORKER_CONCURRENCY",
+                cls.GEVENT_CONCURRENCY if cls.worker_pool == "gevent" else 8,
+            )
+            send_events = (
+                cls.worker_send_task_events
+                or _env_str("FLOWER_ENABLED", "false").lower() == "true"
+            )
+            max_connections = _env_int("REDIS_MAX_CONNECTIONS", concurrency * 2 + 4)
             config.update({
-                "worker_concurrency": int(os.getenv("CELERY_WORKER_CONCURRENCY", "8")),
-                "worker_max_tasks_per_child": 500,  # More conservative in production
+                "worker_concurrency": concurrency,
+                "broker_pool_limit": max_connections,
+                "broker_transport_options": {
+                    **cls.broker_transport_options,
+                    "max_connections": max_connections,
+                },
+                "redis_max_connections": max_connections,
+                "worker_send_task_events": send_events,
+                "task_send_sent_event": send_events,
                 "task_compression": "gzip",
-                "result_compression": "gzip",
                 "worker_log_level": "INFO",
             })
         
@@ -123,22 +329,36 @@ class CeleryConfig:
         return config
 
 
+class TaskLimits(NamedTuple):
+    """Maximum expected duration per task type, in seconds."""
+    generate_course: int = 600  # 10 minutes
+    generate_chapter: int = 120  # 2 minutes (requirement)
+    validate_quality: int = 300  # 5 minutes
+    export_course: int = 180  # 3 minutes
+    regenerate_chapter: int = 120  # 2 minutes
+
+
+class AlertThresholds(NamedTuple):
+    """Thresholds that trigger task queue alerts."""
+    high_failure_rate: float = 10.0  # >10% failure rate
+    high_queue_length: int = 100  # >100 pending tasks
+    worker_down: int = 0  # No workers available
+    slow_processing: int = 150  # >150% of expected time
+
+
 class MonitoringConfig:
     """Configuration for task monitoring and metrics."""
     
+    # Settings are read from the class; instances carry no __dict__
+    __slots__ = ()
+    
     # Flower monitoring (optional)
-    FLOWER_PORT = int(os.getenv("FLOWER_PORT", "5555"))
-    FLOWER_ADDRESS = os.getenv("FLOWER_ADDRESS", "0.0.0.0")
-    FLOWER_URL_PREFIX = os.getenv("FLOWER_URL_PREFIX", "")
+    FLOWER_PORT = _env_int("FLOWER_PORT", 5555)
+    FLOWER_ADDRESS = _env_str("FLOWER_ADDRESS", "0.0.0.0")
+    FLOWER_URL_PREFIX = _env_str("FLOWER_URL_PREFIX", "")
     
     # Performance thresholds
-    MAX_TASK_DURATION = {
-        "generate_course": 600,  # 10 minutes
-        "generate_chapter": 120,  # 2 minutes (requirement)
-        "validate_quality": 300,  # 5 minutes
-        "export_course": 180,  # 3 minutes
-        "regenerate_chapter": 120,  # 2 minutes
-    }
+    MAX_TASK_DURATION = TaskLimits()
     
     # Success rate requirements
     MINIMUM_SUCCESS_RATE = 95.0  # 95% as per requirements
@@ -148,37 +368,50 @@ class MonitoringConfig:
     MAX_QUEUE_SIZE = 500
     
     # Alert thresholds
-    ALERT_THRESHOLDS = {
-        "high_failure_rate": 10.0,  # >10% failure rate
-        "high_queue_length": 100,  # >100 pending tasks
-        "worker_down": 0,  # No workers available
-        "slow_processing": 150,  # >150% of expected time
-    }
+    ALERT_THRESHOLDS = AlertThresholds()
+    
+    _SETTINGS: ClassVar[Tuple[str, ...]] = (
+        "FLOWER_PORT",
+        "FLOWER_ADDRESS",
+        "FLOWER_URL_PREFIX",
+        "MAX_TASK_DURATION",
+        "MINIMUM_SUCCESS_RATE",
+        "MAX_CONCURRENT_COURSES",
+        "MAX_QUEUE_SIZE",
+        "ALERT_THRESHOLDS",
+    )
 
 
 class SecurityConfig:
-    """Security configuration for Celery."""
+    """
+    Security configuration for Celery.
     
-    # Worker security
-    WORKER_HIJACK_ROOT_LOGGER = False
-    WORKER_DISABLE_RATE_LIMITS = False
+    Worker logging and content filtering live on CeleryConfig; only settings
+    CeleryConfig does not define belong here.
+    """
+    
+    # Settings are read from the class; instances carry no __dict__
+    __slots__ = ()
     
     # Redis security
     REDIS_SOCKET_KEEPALIVE = True
+    # Probe idle pooled connections so dead peers are noticed before a
+    # progress write has to reconnect
     REDIS_SOCKET_KEEPALIVE_OPTIONS = {
-        "TCP_KEEPINTVL": 1,
+        "TCP_KEEPIDLE": 30,
+        "TCP_KEEPINTVL": 10,
         "TCP_KEEPCNT": 3,
-        "TCP_KEEPIDLE": 1,
     }
     
     # Task signature verification (if needed)
     TASK_ALWAYS_EAGER = False
     TASK_STORE_EAGER_RESULT = True
     
-    # Content filtering
-    ACCEPT_CONTENT = ["json"]
-    TASK_SERIALIZER = "json"
-    RESULT_SERIALIZER = "json"
+    _SETTINGS: ClassVar[Tuple[str, ...]] = (
+        "REDIS_SOCKET_KEEPALIVE",
+        "TASK_ALWAYS_EAGER",
+        "TASK_STORE_EAGER_RESULT",
+    )
 
 
 def get_celery_config(environment: str = None) -> Dict[str, Any]:
@@ -191,104 +424,299 @@ def get_celery_config(environment: str = None) -> Dict[str, Any]:
     Returns:
         Complete configuration dictionary
     """
-    base_config = CeleryConfig.get_config(environment)
+    env = environment or os.getenv("ENVIRONMENT", "development")
+    
+    # Eager tasks need no broker, workers or monitoring
+    if env == "testing":
+        return dict(_TESTING_CONFIG)
+    
+    base_config = CeleryConfig.get_config(env)
     
     # Add monitoring configuration
-    monitoring = MonitoringConfig()
     base_config["monitoring"] = {
-        attr: getattr(monitoring, attr)
-        for attr in dir(monitoring)
-        if not attr.startswith("_") and not callable(getattr(monitoring, attr))
+        attr: getattr(MonitoringConfig, attr)
+        for attr in MonitoringConfig._SETTINGS
     }
     
-    # Add security configuration
-    security = SecurityConfig()
-    security_config = {
-        attr.lower(): getattr(security, attr)
-        for attr in dir(security)
-        if not attr.startswith("_") and not callable(getattr(security, attr))
+    # Add security configuration without overriding environment settings
+    for attr in SecurityConfig._SETTINGS:
+        base_config.setdefault(attr.lower(), getattr(SecurityConfig, attr))
+    
+    # Broker-side queue declarations (length caps and dead-lettering)
+    base_config["task_queues"] = get_task_queues()
+    
+    # Worker command line matching this configuration (for deployment scripts)
+    base_config["worker_cli_args"] = get_worker_cli_args(base_config)
+    
+    # Apply Redis keepalive tuning to the broker connection pool
+    base_config["broker_transport_options"] = {
+        **base_config["broker_transport_options"],
+        **get_redis_socket_options(),
     }
-    base_config.update(security_config)
     
     return base_config
 
 
-def get_queue_definitions() -> List[Dict[str, Any]]:
+def get_worker_cli_args(config: Dict[str, Any]) -> List[str]:
     """
-    Get queue definitions for different task types.
+    Build ``celery worker`` options for a Celery configuration.
     
+    Fair scheduling (-Ofair) only hands a task to a child process that is
+    free, so a two-minute chapter task never holds prefetched short tasks.
+    Deployment scripts append these to ``celery -A src.tasks.celery_app worker``.
+    
+    Args:
+        config: Celery configuration from ``CeleryConfig.get_config``
+        
     Returns:
-        List of queue configurations
+        Worker command line options
     """
     return [
-        {
-            "name": "course_generation",
-            "routing_key": "course_generation",
-            "priority": 5,
-            "max_length": 50,
-            "description": "Full course generation tasks"
-        },
-        {
-            "name": "chapter_generation",
-            "routing_key": "chapter_generation",
-            "priority": 8,
-            "max_length": 100,
-            "description": "Individual chapter generation tasks"
-        },
-        {
-            "name": "quality_validation",
-            "routing_key": "quality_validation",
-            "priority": 6,
-            "max_length": 75,
-            "description": "Content quality validation tasks"
-        },
-        {
-            "name": "export",
-            "routing_key": "export",
-            "priority": 4,
-            "max_length": 25,
-            "description": "Course export tasks"
-        },
-        {
-            "name": "default",
-            "routing_key": "default",
-            "priority": 3,
-            "max_length": 100,
-            "description": "Default queue for misc tasks"
-        }
+        "-Ofair",
+        f"--pool={config['worker_pool']}",
+        f"--prefetch-multiplier={config['worker_prefetch_multiplier']}",
+        f"--concurrency={config['worker_concurrency']}",
+        f"--max-memory-per-child={config['worker_max_memory_per_child']}",
+        f"--max-tasks-per-child={config['worker_max_tasks_per_child']}",
     ]
 
 
-def get_performance_settings() -> Dict[str, Any]:
+def get_redis_socket_options() -> Dict[str, Any]:
     """
-    Get performance-optimized settings based on requirements.
+    Get keepalive settings for the broker's Redis connection pool.
+    
+    The Redis result backend only takes ``redis_socket_keepalive``; the
+    per-socket timers apply to broker connections.
     
     Returns:
-        Performance configuration
+        Keyword arguments for ``broker_transport_options``
     """
     return {
-        # Concurrency for 100+ simultaneous operations (FR-022)
-        "max_concurrent_courses": 100,
-        "worker_pool_size": int(os.getenv("CELERY_WORKER_CONCURRENCY", "8")),
-        "prefetch_multiplier": 1,  # Prevent worker overload
-        
-        # Time limits per requirements
-        "chapter_generation_limit": 120,  # <2 min requirement
-        "course_generation_limit": 600,  # 10 min reasonable limit
-        "quality_validation_limit": 300,  # 5 min limit
-        
-        # Success rate targeting 95%+ (requirement)
-        "max_retries": 3,
-        "retry_delay": 60,
-        "exponential_backoff": True,
+        "socket_keepalive": SecurityConfig.REDIS_SOCKET_KEEPALIVE,
+        "socket_keepalive_options": _socket_keepalive_options(),
+    }
+
+
+def _socket_keepalive_options() -> Dict[int, int]:
+    """Map SecurityConfig keepalive option names to socket constants."""
+    return {
+        getattr(socket, name): value
+        for name, value in SecurityConfig.REDIS_SOCKET_KEEPALIVE_OPTIONS.items()
+        if hasattr(socket, name)
+    }
+
+
+# Testing overrides: tasks run eagerly in-process against in-memory transports
+_TESTING_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "task_always_eager": True,  # Execute tasks synchronously
+    "task_eager_propagates": True,
+    "task_store_eager_result": True,
+    "broker_url": "memory://",
+    "result_backend": "cache+memory://",
+    "accept_content": CeleryConfig.accept_content,
+})
+
+# Dead-letter routing for messages rejected by full queues
+DEAD_LETTER_EXCHANGE = "dlx"
+DEAD_LETTER_QUEUE = "dead_letter"
+
+# Static queue and performance data, built once per process and shared
+# read-only by every caller
+_QUEUE_DEFINITIONS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "name": "course_generation",
+        "routing_key": "course_generation",
+        "priority": 5,
+        "x-max-priority": 10,
+        "max_length": 50,
+        "description": "Full course generation tasks"
+    }),
+    MappingProxyType({
+        "name": "chapter_generation",
+        "routing_key": "chapter_generation",
+        "priority": 8,
+        "x-max-priority": 10,
+        "max_length": 100,
+        "description": "Individual chapter generation tasks"
+    }),
+    MappingProxyType({
+        "name": "quality_validation",
+        "routing_key": "quality_validation",
+        "priority": 6,
+        "x-max-priority": 10,
+        "max_length": 75,
+        "description": "Content quality validation tasks"
+    }),
+    MappingProxyType({
+        "name": "export",
+        "routing_key": "export",
+        "priority": 4,
+        "x-max-priority": 10,
+        "max_length": 25,
+        "description": "Course export tasks"
+    }),
+    MappingProxyType({
+        "name": "default",
+        "routing_key": "default",
+        "priority": 3,
+        "x-max-priority": 10,
+        "max_length": 100,
+        "description": "Default queue for misc tasks"
+    }),
+)
+
+_PERFORMANCE_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    # Concurrency for 100+ simultaneous operations (FR-022)
+    "max_concurrent_courses": 100,
+    "worker_pool_size": _env_int("CELERY_WORKER_CONCURRENCY", 8),
+    "gevent_concurrency": CeleryConfig.GEVENT_CONCURRENCY,  # IO-bound LLM calls
+    "prefetch_multiplier": CeleryConfig.worker_prefetch_multiplier,
+    
+    # Time limits per requirements
+    "chapter_generation_limit": 120,  # <2 min requirement
+    "course_generation_limit": 600,  # 10 min reasonable limit
+    "quality_validation_limit": 300,  # 5 min limit
+    
+    # Success rate targeting 95%+ (requirement)
+    "max_retries": 3,
+    "retry_delay": CeleryConfig.task_default_retry_delay,
+    "retry_backoff": True,
+    "retry_backoff_max": 600,
+    
+    # Memory and resource management
+    "max_tasks_per_child": CeleryConfig.worker_max_tasks_per_child,
+    "worker_max_memory_per_child": CeleryConfig.worker_max_memory_per_child,
+    "result_expiry": CeleryConfig.result_expires,
+    
+    # Queue management
+    "queue_length_limit": 500,
+    "priority_routing": True,
+    "dead_letter_queue": True,
+})
+
+
+class QueueGroup(NamedTuple):
+    """Queues served by one dedicated worker and its pool size."""
+    queues: Tuple[str, ...]
+    concurrency: Optional[int] = None  # None: the pool's default size
+
+
+# Dedicated workers, so ten-minute course generations never hold slots that
+# short tasks are waiting for. Long tasks get a few processes; IO-bound
+# groups get more slots than cores (gevent sizes the chapter pool itself)
+WORKER_QUEUE_GROUPS: Mapping[str, QueueGroup] = MappingProxyType({
+    "course": QueueGroup(("course_generation",), concurrency=4),
+    "chapter": QueueGroup(("chapter_generation",)),
+    "misc": QueueGroup(("quality_validation", "export", "default"), concurrency=8),
+})
+
+
+def get_queue_definitions() -> Tuple[Mapping[str, Any], ...]:
+    """
+    Get queue definitions for different task types.
+    
+    Returns:
+        Read-only queue configurations
+    """
+    return _QUEUE_DEFINITIONS
+
+
+def get_task_queues() -> Tuple[Queue, ...]:
+    """
+    Build broker queue declarations from the queue definitions.
+    
+    Each queue is capped at its ``max_length`` with overflowing messages
+    rejected to the dead-letter exchange. The arguments are enforced by
+    AMQP brokers; the Redis transport does not apply queue arguments.
+    
+    Returns:
+        Kombu queues including the dead-letter queue
+    """
+    queues = [
+        Queue(
+            definition["name"],
+            routing_key=definition["routing_key"],
+            queue_arguments={
+                "x-max-length": definition["max_length"],
+                "x-overflow": "reject-publish-dlx",
+                "x-dead-letter-exchange": DEAD_LETTER_EXCHANGE,
+                "x-dead-letter-routing-key": DEAD_LETTER_QUEUE,
+                "x-max-priority": definition["x-max-priority"],
+            },
+        )
+        for definition in _QUEUE_DEFINITIONS
+    ]
+    queues.append(
+        Queue(
+            DEAD_LETTER_QUEUE,
+            Exchange(DEAD_LETTER_EXCHANGE, type="direct"),
+            routing_key=DEAD_LETTER_QUEUE,
+        )
+    )
+    return tuple(queues)
+
+
+def get_performance_settings() -> Mapping[str, Any]:
+    """
+    Get performance-optimized settings based on requirements.
+    
+    Returns:
+        Read-only performance configuration
+    """
+    return _PERFORMANCE_SETTINGS
+
+
+def get_routed_queues() -> List[str]:
+    """
+    Get every queue tasks are routed to, in routing table order.
+    
+    Derived from the routing table so workers started without an explicit
+    queue list consume every queue a task can land on.
+    
+    Returns:
+        Queue names, ending with the default queue for unrouted tasks
+    """
+    queues = dict.fromkeys(route["queue"] for route in _ROUTE_TABLE.values())
+    queues[CeleryConfig.task_default_queue] = None
+    return list(queues)
+
+
+def get_prefetch_multiplier(queues: List[str]) -> int:
+    """
+    Get the prefetch multiplier for a worker consuming the given queues.
+    
+    Workers dedicated to queues with an override (course generation, quality
+    validation, export) use the override; mixed workers use the default
+    multiplier.
+    
+    Args:
+        queues: Queue names consumed by the worker
         
-        # Memory and resource management
-        "max_tasks_per_child": 1000,
-        "memory_limit_per_child": "500MB",
-        "result_expiry": 86400,  # 24 hours
+    Returns:
+        Prefetch multiplier
+    """
+    overrides = CeleryConfig.QUEUE_PREFETCH_OVERRIDES
+    if queues and all(queue in overrides for queue in queues):
+        return min(overrides[queue] for queue in queues)
+    return CeleryConfig.worker_prefetch_multiplier
+
+
+def get_worker_pool(queues: List[str]) -> str:
+    """
+    Get the execution pool for a worker consuming the given queues.
+    
+    Workers dedicated to network-bound queues (chapter generation, quality
+    validation) use gevent; mixed workers use the configured default pool.
+    
+    Args:
+        queues: Queue names consumed by the worker
         
-        # Queue management
-        "queue_length_limit": 500,
-        "priority_routing": True,
-        "dead_letter_queue": True,
-    }
\ No newline at end of file
+    Returns:
+        Celery pool name
+    """
+    overrides = CeleryConfig.QUEUE_POOL_OVERRIDES
+    pools = {overrides.get(queue) for queue in queues}
+    if len(pools) == 1 and None not in pools:
+        return pools.pop()
+    return CeleryConfig.worker_pool
+
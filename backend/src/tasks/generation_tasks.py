@@ -5,24 +5,43 @@ Implements async tasks for course creation, chapter generation, quality validati
 and export operations with proper error handling and progress tracking.
 """
 
+import gzip
 import json
 import logging
+import os
 import time
-import traceback
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 from uuid import UUID, uuid4
 
-from celery import Task
+import orjson
+
+from celery import Task, chord, states
+from celery.signals import task_failure, task_retry
 from celery.exceptions import Retry
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from .celery_app import celery_app
+from .config import CeleryConfig
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between progress writes within one phase; consumers poll
+# far less often, so steps inside this window are coalesced into the latest
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Start time of the task running in the current context. Task instances are
+# shared by every execution in a worker process, so this cannot live on self
+_task_start_time: ContextVar[Optional[datetime]] = ContextVar(
+    "task_start_time", default=None
+)
+
 
 # Task status and progress models
 
@@ -58,65 +77,324 @@ class TaskProgress(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+# Serializer for TaskProgress, built once instead of per dump
+_PROGRESS_ADAPTER = TypeAdapter(TaskProgress)
+
+# Plain-string status stored by update_progress, so serializing progress
+# meta never goes through enum handling
+_STATUS_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+
+
+def progress_channel(task_id: str) -> str:
+    """Redis pub/sub channel carrying progress notifications for a task."""
+    return f"task-progress:{task_id}"
+
+
+def get_failure_details(backend, task_id: str) -> Dict[str, Any]:
+    """
+    Read the progress fields stored with a failed task's exception.
+    
+    Celery decodes FAILURE meta into the exception instance, dropping the
+    fields _on_task_failure adds, so the raw stored meta is read instead.
+    Empty when the backend is not a key-value store or nothing was added.
+    """
+    get_key_for_task = getattr(backend, "get_key_for_task", None)
+    if get_key_for_task is None:
+        return {}
+    payload = backend.get(get_key_for_task(task_id))
+    if not payload:
+        return {}
+    result = backend.decode(payload).get("result")
+    return result if isinstance(result, dict) else {}
+
+
 class BaseGenerationTask(Task):
     """Base class for generation tasks with common functionality."""
     
     def __init__(self):
-        self.progress_data = {}
+        # Buffered progress writes per running task, sent by flush_progress()
+        self._progress_pipes = {}
+        # (monotonic time, phase) of the last progress write per running task
+        self._last_progress = {}
+        # Latest throttled update per running task, written by flush_progress()
+        self._pending_progress = {}
+    
+    def _progress_pipeline(self, task_id: str):
+        """Get the buffered Redis pipeline for a task, if the backend has one."""
+        pipe = self._progress_pipes.get(task_id)
+        if pipe is None:
+            client = getattr(self.backend, "client", None)
+            if client is None or not hasattr(client, "pipeline"):
+                return None
+            pipe = self._progress_pipes[task_id] = client.pipeline(transaction=False)
+        return pipe
+    
+    def flush_progress(self, task_id: str) -> None:
+        """Send buffered progress updates to the result backend in one round-trip."""
+        # Tasks flush before blocking work, so the last throttled update is
+        # written now rather than left behind an older one
+        pending = self._pending_progress.pop(task_id, None)
+        if pending is not None:
+            self._write_progress(task_id, *pending)
+        pipe = self._progress_pipes.get(task_id)
+        if pipe is not None and len(pipe):
+            pipe.execute()
+    
+    def after_return(self, status, retval, task_id, args, kwargs, einfo):
+        """Drop unflushed progress so it cannot overwrite the stored final state."""
+        _task_start_time.set(None)
+        self._last_progress.pop(task_id, None)
+        self._pending_progress.pop(task_id, None)
+        pipe = self._progress_pipes.pop(task_id, None)
+        if pipe is not None:
+            pipe.reset()
+        super().after_return(status, retval, task_id, args, kwargs, einfo)
     
     def update_progress(
         self,
         task_id: str,
         progress_percentage: float,
-        phase: GenerationPhase,
+        phase: Union[GenerationPhase, str],
         estimated_remaining: str = "PT0S",
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Update task progress and store in result backend."""
-        progress = TaskProgress(
-            task_id=task_id,
-            status=TaskStatus.IN_PROGRESS,
-            progress_percentage=progress_percentage,
-            current_phase=phase,
-            estimated_time_remaining=estimated_remaining,
-            start_time=self.progress_data.get("start_time", datetime.utcnow()),
-            last_update=datetime.utcnow(),
-            retry_count=self.request.retries,
-            metadata=metadata or {}
+        """
+        Update task progress in the result backend.
+        
+        ``phase`` may be a GenerationPhase or its string value; it is stored
+        as the plain string.
+        
+        With a Redis backend, writes are buffered until flush_progress() (called
+        at phase boundaries) and sent automatically on completion; each write
+        is also published on progress_channel(task_id). Updates arriving
+        within PROGRESS_MIN_INTERVAL of the previous one in the same phase
+        are coalesced: only the latest is kept, and it is written by the next
+        flush_progress() unless a later write supersedes it. 0%, 100% and
+        phase changes are always written.
+        """
+        if isinstance(phase, GenerationPhase):
+            phase = phase.value
+        
+        last = self._last_progress.get(task_id)
+        if (
+            last is not None
+            and 0.0 < progress_percentage < 100.0
+            and phase == last[1]
+            and time.monotonic() - last[0] < PROGRESS_MIN_INTERVAL
+        ):
+            self._pending_progress[task_id] = (
+                progress_percentage, phase, estimated_remaining, metadata
+            )
+            return
+        self._pending_progress.pop(task_id, None)
+        self._write_progress(
+            task_id, progress_percentage, phase, estimated_remaining, metadata
         )
+    
+    def _write_progress(
+        self,
+        task_id: str,
+        progress_percentage: float,
+        phase: str,
+        estimated_remaining: str,
+        metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        self._last_progress[task_id] = (time.monotonic(), phase)
+        
+        # Same shape as TaskProgress; built directly since all inputs are
+        # task-internal and this runs on every progress step
+        now = datetime.utcnow()
+        progress = {
+            "task_id": task_id,
+            "status": _STATUS_IN_PROGRESS,
+            "progress_percentage": progress_percentage,
+            "current_phase": phase,
+            "estimated_time_remaining": estimated_remaining,
+            "start_time": _task_start_time.get() or now,
+            "last_update": now,
+            "error_details": None,
+            "retry_count": self.request.retries,
+            "metadata": metadata or {},
+        }
         
         # Store progress in Redis for monitoring
-        self.update_state(
-            state="PROGRESS",
-            meta=progress.dict()
-        )
+        pipe = self._progress_pipeline(task_id)
+        if pipe is None:
+            self.update_state(
+                state="PROGRESS",
+                meta=progress
+            )
+        else:
+            payload = self.backend.encode({
+                "status": "PROGRESS",
+                "result": progress,
+                "traceback": None,
+                "children": [],
+                "date_done": None,
+                "task_id": task_id,
+            })
+            key = self.backend.get_key_for_task(task_id)
+            if self.backend.expires:
+                pipe.setex(key, self.backend.expires, payload)
+            else:
+                pipe.set(key, payload)
+            pipe.publish(key, payload)
+            # Compact notification for streaming clients, which would
+            # otherwise poll the meta key
+            pipe.publish(
+                progress_channel(task_id),
+                orjson.dumps(progress, option=orjson.OPT_NAIVE_UTC)
+            )
+            if progress_percentage >= 100.0:
+                self.flush_progress(task_id)
         
-        logger.info(f"Task {task_id} progress: {progress_percentage}% - {phase}")
+        logger.info("Task %s progress: %s%% - %s", task_id, progress_percentage, phase)
+
+
+@task_failure.connect
+def _on_task_failure(sender=None, task_id=None, exception=None, einfo=None, **kwargs):
+    """
+    Record the terminal failure of a generation task.
     
-    def handle_error(self, task_id: str, error: Exception) -> None:
-        """Handle task errors with proper logging and progress updates."""
-        error_msg = str(error)
-        error_trace = traceback.format_exc()
-        
-        logger.error(f"Task {task_id} failed: {error_msg}\n{error_trace}")
-        
-        # Update progress with error state
-        progress = TaskProgress(
-            task_id=task_id,
-            status=TaskStatus.FAILED,
-            progress_percentage=0.0,
-            current_phase=GenerationPhase.STRUCTURE,
-            estimated_time_remaining="PT0S",
-            start_time=self.progress_data.get("start_time", datetime.utcnow()),
-            last_update=datetime.utcnow(),
-            error_details=error_msg,
-            retry_count=self.request.retries
+    Runs once retries are exhausted, after Celery has stored the exception.
+    The stored meta is rewritten in one SET with the progress fields added
+    alongside the exception fields, so it still decodes as the exception;
+    status readers get the fields back through get_failure_details.
+    """
+    if not isinstance(sender, BaseGenerationTask):
+        return
+    
+    # Celery's own failure log and the stored meta already carry the traceback
+    logger.error("Task %s failed: %s", task_id, exception)
+    
+    # Inputs are task-internal, so validation is skipped
+    now = datetime.utcnow()
+    progress = TaskProgress.model_construct(
+        task_id=task_id,
+        status=TaskStatus.FAILED,
+        progress_percentage=0.0,
+        current_phase=GenerationPhase.STRUCTURE,
+        estimated_time_remaining="PT0S",
+        start_time=_task_start_time.get() or now,
+        last_update=now,
+        error_details=str(exception),
+        retry_count=sender.request.retries
+    )
+    meta = _PROGRESS_ADAPTER.dump_python(progress, mode="json")
+    
+    # Let streaming clients stop waiting on the progress channel
+    client = getattr(sender.backend, "client", None)
+    if client is not None:
+        client.publish(progress_channel(task_id), orjson.dumps(meta))
+    
+    meta.update(sender.backend.prepare_exception(exception))
+    sender.backend.store_result(
+        task_id,
+        meta,
+        states.FAILURE,
+        traceback=einfo.traceback if einfo else None,
+        request=sender.request
+    )
+
+
+@task_retry.connect
+def _on_task_retry(sender=None, request=None, reason=None, **kwargs):
+    """Log generation task retries scheduled by autoretry_for."""
+    if isinstance(sender, BaseGenerationTask):
+        logger.warning(
+            "Retrying %s task %s (attempt %d): %s",
+            sender.name, request.id, request.retries + 1, reason
         )
+
+
+def _store_course_result(course_id: str, task_id: str, course: Dict[str, Any]) -> str:
+    """
+    Write a complete course to the shared results directory.
+    
+    Returns:
+        ``file://`` URL of the gzip-compressed JSON document
+    """
+    path = Path(CeleryConfig.COURSE_RESULTS_DIR) / course_id / f"{task_id}.json.gz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Write then rename so readers never see a partial file
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(
+        gzip.compress(orjson.dumps(course, option=orjson.OPT_NAIVE_UTC), compresslevel=6)
+    )
+    tmp_path.replace(path)
+    return path.as_uri()
+
+
+def load_course_result(result_url: str) -> Dict[str, Any]:
+    """
+    Load a complete course stored by course generation.
+    
+    Args:
+        result_url: ``result_url`` from the generate_course_task result
         
-        self.update_state(
-            state="FAILURE",
-            meta=progress.dict()
-        )
+    Returns:
+        Generated course data with chapters and metadata
+    """
+    path = Path(url2pathname(urlparse(result_url).path))
+    return orjson.loads(gzip.decompress(path.read_bytes()))
+
+
+def _batch_uuids(count: int) -> List[str]:
+    """Generate ``count`` random (version 4) UUID strings from one urandom call."""
+    buf = os.urandom(16 * count)
+    return [
+        str(UUID(bytes=buf[i:i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
+
+
+def _build_subchapter(index: int, chapter_title: str, subchapter_id: str) -> Dict[str, Any]:
+    """Build the placeholder content for subchapter ``index`` (0-based) of a chapter."""
+    number = index + 1
+    return {
+        "id": subchapter_id,
+        "sequence_number": number,
+        "title": f"{chapter_title} - Section {number}",
+        "content_type": "mixed" if index % 2 == 0 else "theory",
+        "content_blocks": [
+            {
+                "type": "text",
+                "content": f"Content for section {number} of the chapter...",
+                "order": 1,
+                "metadata": {"word_count": 250}
+            }
+        ],
+        "key_concepts": [f"Concept {number}.1", f"Concept {number}.2"],
+        "summary": f"Summary of section {number}"
+    }
+
+
+# Export file descriptions by format; unknown formats export as JSON.
+# processing_seconds simulates format-specific rendering time
+_EXPORT_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "pdf": {
+        "filename_pattern": "course_{course_id}.pdf",
+        "url_pattern": "/exports/pdf/course_{course_id}.pdf",
+        "size_bytes": 2048576,  # ~2MB
+        "type": "application/pdf",
+        "processing_seconds": 2,
+    },
+    "scorm": {
+        "filename_pattern": "course_{course_id}_scorm.zip",
+        "url_pattern": "/exports/scorm/course_{course_id}_scorm.zip",
+        "size_bytes": 5242880,  # ~5MB
+        "type": "application/zip",
+        "processing_seconds": 3,
+    },
+    "json": {
+        "filename_pattern": "course_{course_id}.json",
+        "url_pattern": "/exports/json/course_{course_id}.json",
+        "size_bytes": 1048576,  # ~1MB
+        "type": "application/json",
+        "processing_seconds": 0,
+    },
+}
 
 
 @celery_app.task(
@@ -127,7 +405,7 @@ class BaseGenerationTask(Task):
     soft_time_limit=600,  # 10 minutes for full course
     time_limit=660,
     autoretry_for=(Exception,),
-    retry_backoff=True,
+    retry_backoff=60,
     retry_jitter=True
 )
 def generate_course_task(
@@ -138,159 +416,205 @@ def generate_course_task(
     """
     Generate a complete course with chapters and content.
     
+    Builds the course structure, then replaces itself with a chord of
+    generate_chapter_task subtasks (one per chapter, spread across workers)
+    whose results assemble_course_task combines under this task's id.
+    
     Args:
         course_data: Course creation data following CourseCreate schema
         user_preferences: Optional user preferences for generation
         
     Returns:
-        Generated course data with chapters and metadata
+        Course id, status and ``result_url`` of the stored course; load it
+        with load_course_result()
         
     Raises:
         Exception: If generation fails after all retries
     """
     task_id = self.request.id
-    course_id = course_data.get("id") or str(uuid4())
+    num_chapters = 5  # Based on course complexity
     
-    try:
-        # Initialize progress tracking
-        self.progress_data["start_time"] = datetime.utcnow()
-        self.update_progress(
-            task_id=task_id,
-            progress_percentage=0.0,
-            phase=GenerationPhase.STRUCTURE,
-            estimated_remaining="PT10M"
-        )
-        
-        logger.info(f"Starting course generation for course {course_id}")
-        
-        # Phase 1: Generate course structure (20%)
-        self.update_progress(task_id, 10.0, GenerationPhase.STRUCTURE, "PT8M")
-        
-        # Simulate structure generation
-        num_chapters = 5  # Based on course complexity
-        chapter_structure = []
-        for i in range(num_chapters):
-            chapter_structure.append({
-                "id": str(uuid4()),
-                "sequence_number": i + 1,
-                "title": f"Chapter {i + 1}: {course_data.get('title', 'Unknown')} - Part {i + 1}",
-                "estimated_duration": "PT2H",
-                "complexity_level": 2.0 + (i * 0.5),
-                "learning_objectives": [
-                    f"Understand concepts in chapter {i + 1}",
-                    f"Apply knowledge from chapter {i + 1}"
-                ]
-            })
-        
-        self.update_progress(task_id, 20.0, GenerationPhase.STRUCTURE, "PT7M")
-        
-        # Phase 2: Generate content for each chapter (60%)
-        self.update_progress(task_id, 25.0, GenerationPhase.CONTENT, "PT6M")
-        
-        generated_chapters = []
-        for idx, chapter in enumerate(chapter_structure):
-            # Generate chapter content
-            chapter_progress = 25.0 + ((idx + 1) / num_chapters) * 55.0
-            self.update_progress(
-                task_id, 
-                chapter_progress, 
-                GenerationPhase.CONTENT,
-                f"PT{max(1, 6 - idx)}M"
-            )
-            
-            # Simulate chapter generation time
-            time.sleep(2)  # Simulated AI processing
-            
-            # Generate chapter content
-            chapter_content = {
-                **chapter,
-                "content_outline": f"Detailed content for {chapter['title']}",
-                "subchapters": [
-                    {
-                        "id": str(uuid4()),
-                        "sequence_number": 1,
-                        "title": f"{chapter['title']} - Introduction",
-                        "content_type": "theory",
-                        "content_blocks": [
-                            {
-                                "type": "text",
-                                "content": f"Introduction to {chapter['title']}...",
-                                "order": 1,
-                                "metadata": {}
-                            }
-                        ],
-                        "key_concepts": ["Key concept 1", "Key concept 2"]
-                    }
-                ]
-            }
-            generated_chapters.append(chapter_content)
-        
-        # Phase 3: Generate assessments (15%)
-        self.update_progress(task_id, 80.0, GenerationPhase.ASSESSMENT, "PT2M")
-        
-        # Generate final assessment
-        final_assessment = {
-            "id": str(uuid4()),
-            "type": "final",
-            "title": f"Final Assessment - {course_data.get('title', 'Course')}",
-            "questions": [
-                {
-                    "id": str(uuid4()),
-                    "type": "multiple_choice",
-                    "question": "Which concept is fundamental to this course?",
-                    "options": ["Option A", "Option B", "Option C", "Option D"],
-                    "correct_answer": "Option A",
-                    "difficulty": "medium"
-                }
+    # Course and chapter ids
+    new_ids = _batch_uuids(num_chapters + 1)
+    course_id = course_data.get("id") or new_ids[0]
+    chapter_ids = new_ids[1:]
+    
+    # Initialize progress tracking
+    _task_start_time.set(datetime.utcnow())
+    self.update_progress(
+        task_id=task_id,
+        progress_percentage=0.0,
+        phase=GenerationPhase.STRUCTURE,
+        estimated_remaining="PT10M"
+    )
+    
+    logger.info(f"Starting course generation for course {course_id}")
+    
+    # Phase 1: Generate course structure (20%)
+    self.update_progress(task_id, 10.0, GenerationPhase.STRUCTURE, "PT8M")
+    
+    # Simulate structure generation
+    course_title = course_data.get("title", "Unknown")
+    chapter_structure = []
+    for i, chapter_id in enumerate(chapter_ids, start=1):
+        chapter_structure.append({
+            "id": chapter_id,
+            "sequence_number": i,
+            "title": f"Chapter {i}: {course_title} - Part {i}",
+            "estimated_duration": "PT2H",
+            "complexity_level": 1.5 + (i * 0.5),
+            "learning_objectives": [
+                f"Understand concepts in chapter {i}",
+                f"Apply knowledge from chapter {i}"
             ]
-        }
-        
-        self.update_progress(task_id, 90.0, GenerationPhase.ASSESSMENT, "PT1M")
-        
-        # Phase 4: Final validation (10%)
-        self.update_progress(task_id, 95.0, GenerationPhase.VALIDATION, "PT30S")
-        
-        # Validate generated content
-        quality_metrics = {
-            "readability_score": 85.5,
-            "pedagogical_alignment": 0.92,
-            "objective_coverage": 0.95,
-            "content_accuracy": 0.88,
-            "bias_detection_score": 0.97,
-            "generation_timestamp": datetime.utcnow().isoformat()
-        }
-        
-        # Complete course data
-        complete_course = {
-            "id": course_id,
-            "status": "ready",
-            "chapters": generated_chapters,
-            "final_assessment": final_assessment,
-            "quality_metrics": quality_metrics,
-            "generation_metadata": {
-                "task_id": task_id,
-                "generation_time": datetime.utcnow().isoformat(),
-                "total_duration": str(datetime.utcnow() - self.progress_data["start_time"]),
-                "retry_count": self.request.retries
-            },
-            **course_data
-        }
-        
-        # Complete task
-        self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
-        
-        logger.info(f"Course generation completed for course {course_id}")
-        return complete_course
-        
-    except Exception as exc:
-        self.handle_error(task_id, exc)
+        })
+    
+    self.update_progress(task_id, 20.0, GenerationPhase.STRUCTURE, "PT7M")
+    
+    # Phase 2: Generate content for each chapter (60%)
+    self.update_progress(task_id, 25.0, GenerationPhase.CONTENT, "PT6M")
+    self.flush_progress(task_id)
+    
+    # Chapters are independent, so fan them out to the chapter_generation
+    # queue; the assembly callback inherits this task's id and result
+    course_context = {**course_data, "id": course_id}
+    return self.replace(course_generation_chord(
+        chapter_structure,
+        course_context,
+        _task_start_time.get().isoformat(),
+        self.request.retries
+    ))
+
+
+@celery_app.task(
+    bind=True,
+    base=BaseGenerationTask,
+    name="src.tasks.generation_tasks.assemble_course_task",
+    max_retries=3,
+    soft_time_limit=110,
+    time_limit=120,
+    autoretry_for=(Exception,),
+    retry_backoff=10,
+    retry_jitter=True
+)
+def assemble_course_task(
+    self,
+    generated_chapters: List[Dict[str, Any]],
+    course_data: Dict[str, Any],
+    start_time: str,
+    generation_retries: int = 0
+) -> Dict[str, Any]:
+    """
+    Assemble generated chapters into the complete course.
+    
+    Runs as the chord callback of generate_course_task, under its task id.
+    
+    Args:
+        generated_chapters: generate_chapter_task results, in chapter order
+        course_data: Course creation data, with the resolved course id
+        start_time: ISO timestamp at which course generation started
+        generation_retries: Retries used by generate_course_task
         
-        # Retry if under limit
-        if self.request.retries < self.max_retries:
-            logger.warning(f"Retrying course generation for course {course_id} (attempt {self.request.retries + 1})")
-            raise self.retry(countdown=60 * (2 ** self.request.retries), exc=exc)
+    Returns:
+        Course id, status and ``result_url`` of the stored course
+    """
+    task_id = self.request.id
+    course_id = course_data["id"]
+    assessment_id, question_id = _batch_uuids(2)
+    
+    _task_start_time.set(datetime.fromisoformat(start_time))
+    
+    # Phase 3: Generate assessments (15%)
+    self.update_progress(task_id, 80.0, GenerationPhase.ASSESSMENT, "PT2M")
+    
+    # Generate final assessment
+    final_assessment = {
+        "id": assessment_id,
+        "type": "final",
+        "title": f"Final Assessment - {course_data.get('title', 'Course')}",
+        "questions": [
+            {
+                "id": question_id,
+                "type": "multiple_choice",
+                "question": "Which concept is fundamental to this course?",
+                "options": ["Option A", "Option B", "Option C", "Option D"],
+                "correct_answer": "Option A",
+                "difficulty": "medium"
+            }
+        ]
+    }
+    
+    self.update_progress(task_id, 90.0, GenerationPhase.ASSESSMENT, "PT1M")
+    
+    # Phase 4: Final validation (10%)
+    self.update_progress(task_id, 95.0, GenerationPhase.VALIDATION, "PT30S")
+    
+    # Validate generated content
+    quality_metrics = {
+        "readability_score": 85.5,
+        "pedagogical_alignment": 0.92,
+        "objective_coverage": 0.95,
+        "content_accuracy": 0.88,
+        "bias_detection_score": 0.97,
+        "generation_timestamp": datetime.utcnow()
+    }
+    
+    # Complete course data
+    complete_course = {
+        "id": course_id,
+        "status": "ready",
+        "chapters": generated_chapters,
+        "final_assessment": final_assessment,
+        "quality_metrics": quality_metrics,
+        "generation_metadata": {
+            "task_id": task_id,
+            "generation_time": datetime.utcnow(),
+            "total_duration": str(datetime.utcnow() - _task_start_time.get()),
+            "retry_count": generation_retries + self.request.retries
+        },
+        **course_data
+    }
+    
+    # Keep the (potentially multi-megabyte) course out of Redis; the result
+    # backend only stores where to find it
+    result_url = _store_course_result(course_id, task_id, complete_course)
+    
+    # Complete task
+    self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
+    
+    logger.info(f"Course generation completed for course {course_id}")
+    return {
+        "course_id": course_id,
+        "status": "ready",
+        "result_url": result_url
+    }
+
+
+def course_generation_chord(
+    chapters: List[Dict[str, Any]],
+    course_context: Dict[str, Any],
+    start_time: str,
+    generation_retries: int = 0
+) -> chord:
+    """
+    Build the chord that generates chapters in parallel and assembles the course.
+    
+    Args:
+        chapters: Chapter creation data, in course order
+        course_context: Course creation data, with the resolved course id
+        start_time: ISO timestamp at which course generation started
+        generation_retries: Retries used by generate_course_task
         
-        raise exc
+    Returns:
+        Chord of generate_chapter_task subtasks with assemble_course_task
+        as the callback
+    """
+    header = [
+        generate_chapter_task.s(chapter, course_context)
+        for chapter in chapters
+    ]
+    body = assemble_course_task.s(course_context, start_time, generation_retries)
+    return chord(header, body)
 
 
 @celery_app.task(
@@ -301,7 +625,8 @@ def generate_course_task(
     soft_time_limit=110,  # <2 min as per requirements
     time_limit=120,
     autoretry_for=(Exception,),
-    retry_backoff=True
+    retry_backoff=30,
+    retry_jitter=True
 )
 def generate_chapter_task(
     self,
@@ -319,94 +644,71 @@ def generate_chapter_task(
         Generated chapter with subchapters and content
     """
     task_id = self.request.id
-    chapter_id = chapter_data.get("id") or str(uuid4())
+    num_subchapters = 3
     
-    try:
-        self.progress_data["start_time"] = datetime.utcnow()
-        self.update_progress(
-            task_id=task_id,
-            progress_percentage=0.0,
-            phase=GenerationPhase.CONTENT,
-            estimated_remaining="PT2M"
-        )
-        
-        logger.info(f"Starting chapter generation for chapter {chapter_id}")
-        
-        # Generate subchapters (50%)
-        self.update_progress(task_id, 25.0, GenerationPhase.CONTENT, "PT90S")
-        
-        num_subchapters = 3
-        subchapters = []
-        
-        for i in range(num_subchapters):
-            subchapter = {
-                "id": str(uuid4()),
-                "sequence_number": i + 1,
-                "title": f"{chapter_data.get('title', 'Chapter')} - Section {i + 1}",
-                "content_type": "mixed" if i % 2 == 0 else "theory",
-                "content_blocks": [
-                    {
-                        "type": "text",
-                        "content": f"Content for section {i + 1} of the chapter...",
-                        "order": 1,
-                        "metadata": {"word_count": 250}
-                    }
-                ],
-                "key_concepts": [f"Concept {i + 1}.1", f"Concept {i + 1}.2"],
-                "summary": f"Summary of section {i + 1}"
+    # Chapter, subchapter, quiz and question ids
+    new_ids = _batch_uuids(num_subchapters + 3)
+    chapter_id = chapter_data.get("id") or new_ids[0]
+    subchapter_ids = new_ids[1:num_subchapters + 1]
+    quiz_id, question_id = new_ids[num_subchapters + 1:]
+    
+    _task_start_time.set(datetime.utcnow())
+    self.update_progress(
+        task_id=task_id,
+        progress_percentage=0.0,
+        phase=GenerationPhase.CONTENT,
+        estimated_remaining="PT2M"
+    )
+    
+    logger.info(f"Starting chapter generation for chapter {chapter_id}")
+    
+    # Generate subchapters (50%)
+    self.update_progress(task_id, 25.0, GenerationPhase.CONTENT, "PT90S")
+    
+    chapter_title = chapter_data.get("title", "Chapter")
+    subchapters = [
+        _build_subchapter(i, chapter_title, subchapter_ids[i])
+        for i in range(num_subchapters)
+    ]
+    
+    # Generate chapter quiz (25%)
+    self.update_progress(task_id, 75.0, GenerationPhase.ASSESSMENT, "PT30S")
+    
+    chapter_quiz = {
+        "id": quiz_id,
+        "type": "chapter",
+        "title": f"Quiz - {chapter_data.get('title', 'Chapter')}",
+        "questions": [
+            {
+                "id": question_id,
+                "type": "multiple_choice",
+                "question": f"What is the main concept in {chapter_data.get('title', 'this chapter')}?",
+                "options": ["Option A", "Option B", "Option C"],
+                "correct_answer": "Option A",
+                "difficulty": "medium"
             }
-            subchapters.append(subchapter)
-            
-            progress = 25.0 + ((i + 1) / num_subchapters) * 50.0
-            self.update_progress(task_id, progress, GenerationPhase.CONTENT, "PT60S")
-        
-        # Generate chapter quiz (25%)
-        self.update_progress(task_id, 75.0, GenerationPhase.ASSESSMENT, "PT30S")
-        
-        chapter_quiz = {
-            "id": str(uuid4()),
-            "type": "chapter",
-            "title": f"Quiz - {chapter_data.get('title', 'Chapter')}",
-            "questions": [
-                {
-                    "id": str(uuid4()),
-                    "type": "multiple_choice",
-                    "question": f"What is the main concept in {chapter_data.get('title', 'this chapter')}?",
-                    "options": ["Option A", "Option B", "Option C"],
-                    "correct_answer": "Option A",
-                    "difficulty": "medium"
-                }
-            ]
-        }
-        
-        # Final assembly (25%)
-        self.update_progress(task_id, 90.0, GenerationPhase.VALIDATION, "PT10S")
-        
-        complete_chapter = {
-            "id": chapter_id,
-            "subchapters": subchapters,
-            "chapter_quiz": chapter_quiz,
-            "generation_metadata": {
-                "task_id": task_id,
-                "generation_time": datetime.utcnow().isoformat(),
-                "total_duration": str(datetime.utcnow() - self.progress_data["start_time"])
-            },
-            **chapter_data
-        }
-        
-        self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
-        
-        logger.info(f"Chapter generation completed for chapter {chapter_id}")
-        return complete_chapter
-        
-    except Exception as exc:
-        self.handle_error(task_id, exc)
-        
-        if self.request.retries < self.max_retries:
-            logger.warning(f"Retrying chapter generation for chapter {chapter_id}")
-            raise self.retry(countdown=30 * (2 ** self.request.retries), exc=exc)
-        
-        raise exc
+        ]
+    }
+    
+    # Final assembly (25%)
+    self.update_progress(task_id, 90.0, GenerationPhase.VALIDATION, "PT10S")
+    
+    complete_chapter = {
+        "id": chapter_id,
+        "subchapters": subchapters,
+        "chapter_quiz": chapter_quiz,
+        "generation_metadata": {
+            "task_id": task_id,
+            "generation_time": datetime.utcnow(),
+            "total_duration": str(datetime.utcnow() - _task_start_time.get())
+        },
+        **chapter_data
+    }
+    
+    self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
+    
+    logger.info(f"Chapter generation completed for chapter {chapter_id}")
+    return complete_chapter
 
 
 @celery_app.task(
@@ -415,7 +717,10 @@ def generate_chapter_task(
     name="src.tasks.generation_tasks.validate_quality_task",
     max_retries=2,
     soft_time_limit=300,  # 5 minutes for quality validation
-    time_limit=360
+    time_limit=360,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_jitter=True
 )
 def validate_quality_task(
     self,
@@ -435,65 +740,57 @@ def validate_quality_task(
     task_id = self.request.id
     content_id = content_data.get("id", "unknown")
     
-    try:
-        self.progress_data["start_time"] = datetime.utcnow()
-        self.update_progress(
-            task_id=task_id,
-            progress_percentage=0.0,
-            phase=GenerationPhase.VALIDATION,
-            estimated_remaining="PT5M"
-        )
-        
-        logger.info(f"Starting quality validation for content {content_id}")
-        
-        # Readability analysis (25%)
-        self.update_progress(task_id, 10.0, GenerationPhase.VALIDATION, "PT4M")
-        time.sleep(1)  # Simulate processing
-        
-        readability_score = 85.5  # Simulated analysis
-        self.update_progress(task_id, 25.0, GenerationPhase.VALIDATION, "PT3M")
-        
-        # Pedagogical alignment check (25%)
-        pedagogical_alignment = 0.92
-        self.update_progress(task_id, 50.0, GenerationPhase.VALIDATION, "PT2M")
-        
-        # Content accuracy validation (25%)
-        content_accuracy = 0.88
-        self.update_progress(task_id, 75.0, GenerationPhase.VALIDATION, "PT1M")
-        
-        # Bias detection (25%)
-        bias_score = 0.97
-        self.update_progress(task_id, 90.0, GenerationPhase.VALIDATION, "PT30S")
-        
-        # Generate final metrics
-        quality_metrics = {
-            "readability_score": readability_score,
-            "pedagogical_alignment": pedagogical_alignment,
-            "objective_coverage": 0.95,
-            "content_accuracy": content_accuracy,
-            "bias_detection_score": bias_score,
-            "user_satisfaction_score": None,  # Will be updated after user feedback
-            "generation_timestamp": datetime.utcnow().isoformat(),
-            "validation_criteria": validation_criteria or {},
-            "validation_metadata": {
-                "task_id": task_id,
-                "validation_time": datetime.utcnow().isoformat(),
-                "content_id": content_id
-            }
+    _task_start_time.set(datetime.utcnow())
+    self.update_progress(
+        task_id=task_id,
+        progress_percentage=0.0,
+        phase=GenerationPhase.VALIDATION,
+        estimated_remaining="PT5M"
+    )
+    
+    logger.info(f"Starting quality validation for content {content_id}")
+    
+    # Readability analysis (25%)
+    self.update_progress(task_id, 10.0, GenerationPhase.VALIDATION, "PT4M")
+    self.flush_progress(task_id)
+    time.sleep(1)  # Simulate processing
+    
+    readability_score = 85.5  # Simulated analysis
+    self.update_progress(task_id, 25.0, GenerationPhase.VALIDATION, "PT3M")
+    
+    # Pedagogical alignment check (25%)
+    pedagogical_alignment = 0.92
+    self.update_progress(task_id, 50.0, GenerationPhase.VALIDATION, "PT2M")
+    
+    # Content accuracy validation (25%)
+    content_accuracy = 0.88
+    self.update_progress(task_id, 75.0, GenerationPhase.VALIDATION, "PT1M")
+    
+    # Bias detection (25%)
+    bias_score = 0.97
+    self.update_progress(task_id, 90.0, GenerationPhase.VALIDATION, "PT30S")
+    
+    # Generate final metrics
+    quality_metrics = {
+        "readability_score": readability_score,
+        "pedagogical_alignment": pedagogical_alignment,
+        "objective_coverage": 0.95,
+        "content_accuracy": content_accuracy,
+        "bias_detection_score": bias_score,
+        "user_satisfaction_score": None,  # Will be updated after user feedback
+        "generation_timestamp": datetime.utcnow(),
+        "validation_criteria": validation_criteria or {},
+        "validation_metadata": {
+            "task_id": task_id,
+            "validation_time": datetime.utcnow(),
+            "content_id": content_id
         }
-        
-        self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
-        
-        logger.info(f"Quality validation completed for content {content_id}")
-        return quality_metrics
-        
-    except Exception as exc:
-        self.handle_error(task_id, exc)
-        
-        if self.request.retries < self.max_retries:
-            raise self.retry(countdown=60, exc=exc)
-        
-        raise exc
+    }
+    
+    self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
+    
+    logger.info(f"Quality validation completed for content {content_id}")
+    return quality_metrics
 
 
 @celery_app.task(
@@ -502,7 +799,10 @@ def validate_quality_task(
     name="src.tasks.generation_tasks.export_course_task",
     max_retries=2,
     soft_time_limit=180,  # 3 minutes for export
-    time_limit=240
+    time_limit=240,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_jitter=True
 )
 def export_course_task(
     self,
@@ -524,86 +824,58 @@ def export_course_task(
     task_id = self.request.id
     course_id = course_data.get("id", "unknown")
     
-    try:
-        self.progress_data["start_time"] = datetime.utcnow()
-        self.update_progress(
-            task_id=task_id,
-            progress_percentage=0.0,
-            phase=GenerationPhase.EXPORT,
-            estimated_remaining="PT3M"
-        )
-        
-        logger.info(f"Starting export for course {course_id} to format {export_format}")
-        
-        # Prepare content (30%)
-        self.update_progress(task_id, 15.0, GenerationPhase.EXPORT, "PT2M30S")
-        time.sleep(1)  # Simulate content preparation
-        
-        # Generate export files (60%)
-        self.update_progress(task_id, 30.0, GenerationPhase.EXPORT, "PT2M")
-        
-        # Simulate format-specific processing
-        if export_format.lower() == "pdf":
-            # PDF generation simulation
-            time.sleep(2)
-            export_files = [
-                {
-                    "filename": f"course_{course_id}.pdf",
-                    "url": f"/exports/pdf/course_{course_id}.pdf",
-                    "size_bytes": 2048576,  # ~2MB
-                    "type": "application/pdf"
-                }
-            ]
-        elif export_format.lower() == "scorm":
-            # SCORM package generation
-            time.sleep(3)
-            export_files = [
-                {
-                    "filename": f"course_{course_id}_scorm.zip",
-                    "url": f"/exports/scorm/course_{course_id}_scorm.zip",
-                    "size_bytes": 5242880,  # ~5MB
-                    "type": "application/zip"
-                }
-            ]
-        else:
-            # JSON or other formats
-            export_files = [
-                {
-                    "filename": f"course_{course_id}.json",
-                    "url": f"/exports/json/course_{course_id}.json",
-                    "size_bytes": 1048576,  # ~1MB
-                    "type": "application/json"
-                }
-            ]
-        
-        self.update_progress(task_id, 90.0, GenerationPhase.EXPORT, "PT30S")
-        
-        # Finalize export
-        export_result = {
-            "course_id": course_id,
-            "export_format": export_format,
-            "files": export_files,
-            "export_metadata": {
-                "task_id": task_id,
-                "export_time": datetime.utcnow().isoformat(),
-                "total_duration": str(datetime.utcnow() - self.progress_data["start_time"]),
-                "options": export_options or {}
-            },
-            "download_expires": (datetime.utcnow() + timedelta(days=30)).isoformat()
+    _task_start_time.set(datetime.utcnow())
+    self.update_progress(
+        task_id=task_id,
+        progress_percentage=0.0,
+        phase=GenerationPhase.EXPORT,
+        estimated_remaining="PT3M"
+    )
+    
+    logger.info(f"Starting export for course {course_id} to format {export_format}")
+    
+    # Prepare content (30%)
+    self.update_progress(task_id, 15.0, GenerationPhase.EXPORT, "PT2M30S")
+    self.flush_progress(task_id)
+    time.sleep(1)  # Simulate content preparation
+    
+    # Generate export files (60%)
+    self.update_progress(task_id, 30.0, GenerationPhase.EXPORT, "PT2M")
+    
+    # Simulate format-specific processing
+    template = _EXPORT_TEMPLATES.get(export_format.lower(), _EXPORT_TEMPLATES["json"])
+    if template["processing_seconds"]:
+        self.flush_progress(task_id)
+        time.sleep(template["processing_seconds"])
+    export_files = [
+        {
+            "filename": template["filename_pattern"].format(course_id=course_id),
+            "url": template["url_pattern"].format(course_id=course_id),
+            "size_bytes": template["size_bytes"],
+            "type": template["type"],
         }
-        
-        self.update_progress(task_id, 100.0, GenerationPhase.EXPORT, "PT0S")
-        
-        logger.info(f"Export completed for course {course_id}")
-        return export_result
-        
-    except Exception as exc:
-        self.handle_error(task_id, exc)
-        
-        if self.request.retries < self.max_retries:
-            raise self.retry(countdown=60, exc=exc)
-        
-        raise exc
+    ]
+    
+    self.update_progress(task_id, 90.0, GenerationPhase.EXPORT, "PT30S")
+    
+    # Finalize export
+    export_result = {
+        "course_id": course_id,
+        "export_format": export_format,
+        "files": export_files,
+        "export_metadata": {
+            "task_id": task_id,
+            "export_time": datetime.utcnow(),
+            "total_duration": str(datetime.utcnow() - _task_start_time.get()),
+            "options": export_options or {}
+        },
+        "download_expires": datetime.utcnow() + timedelta(days=30)
+    }
+    
+    self.update_progress(task_id, 100.0, GenerationPhase.EXPORT, "PT0S")
+    
+    logger.info(f"Export completed for course {course_id}")
+    return export_result
 
 
 @celery_app.task(
@@ -612,7 +884,10 @@ def export_course_task(
     name="src.tasks.generation_tasks.regenerate_chapter_task",
     max_retries=3,
     soft_time_limit=110,  # <2 min like generate_chapter_task
-    time_limit=120
+    time_limit=120,
+    autoretry_for=(Exception,),
+    retry_backoff=30,
+    retry_jitter=True
 )
 def regenerate_chapter_task(
     self,
@@ -635,103 +910,95 @@ def regenerate_chapter_task(
     """
     task_id = self.request.id
     
-    try:
-        self.progress_data["start_time"] = datetime.utcnow()
-        self.update_progress(
-            task_id=task_id,
-            progress_percentage=0.0,
-            phase=GenerationPhase.CONTENT,
-            estimated_remaining="PT2M",
-            metadata={"regeneration_reason": regeneration_reason}
-        )
-        
-        logger.info(f"Starting chapter regeneration for chapter {chapter_id}: {regeneration_reason}")
-        
-        # Analyze regeneration requirements (20%)
-        self.update_progress(task_id, 10.0, GenerationPhase.CONTENT, "PT90S")
-        time.sleep(1)
-        
-        # Apply regeneration improvements based on reason
-        improvement_focus = "general"
-        if "too advanced" in regeneration_reason.lower():
-            improvement_focus = "simplify"
-        elif "too basic" in regeneration_reason.lower():
-            improvement_focus = "deepen"
-        elif "accuracy" in regeneration_reason.lower():
-            improvement_focus = "accuracy"
-        
-        self.update_progress(
-            task_id, 
-            20.0, 
-            GenerationPhase.CONTENT, 
-            "PT80S",
-            metadata={"improvement_focus": improvement_focus}
-        )
-        
-        # Generate improved content (60%)
-        regenerated_chapter = {
-            "id": chapter_id,
-            "title": f"Improved Chapter - {course_context.get('title', 'Course')}",
-            "learning_objectives": [
-                "Improved learning objective 1",
-                "Enhanced learning objective 2"
-            ],
-            "content_outline": f"Regenerated content outline based on: {regeneration_reason}",
-            "subchapters": [
-                {
-                    "id": str(uuid4()),
-                    "sequence_number": 1,
-                    "title": "Improved Introduction",
-                    "content_type": "mixed",
-                    "content_blocks": [
-                        {
-                            "type": "text",
-                            "content": f"Improved content addressing: {regeneration_reason}",
-                            "order": 1,
-                            "metadata": {"improvement_focus": improvement_focus}
-                        }
-                    ],
-                    "key_concepts": ["Improved concept 1", "Enhanced concept 2"]
-                }
-            ],
-            "regeneration_metadata": {
-                "task_id": task_id,
-                "original_chapter_id": chapter_id,
-                "regeneration_reason": regeneration_reason,
-                "improvement_focus": improvement_focus,
-                "regeneration_time": datetime.utcnow().isoformat(),
-                "options": regeneration_options or {}
+    _task_start_time.set(datetime.utcnow())
+    self.update_progress(
+        task_id=task_id,
+        progress_percentage=0.0,
+        phase=GenerationPhase.CONTENT,
+        estimated_remaining="PT2M",
+        metadata={"regeneration_reason": regeneration_reason}
+    )
+    
+    logger.info(f"Starting chapter regeneration for chapter {chapter_id}: {regeneration_reason}")
+    
+    # Analyze regeneration requirements (20%)
+    self.update_progress(task_id, 10.0, GenerationPhase.CONTENT, "PT90S")
+    self.flush_progress(task_id)
+    time.sleep(1)
+    
+    # Apply regeneration improvements based on reason
+    improvement_focus = "general"
+    if "too advanced" in regeneration_reason.lower():
+        improvement_focus = "simplify"
+    elif "too basic" in regeneration_reason.lower():
+        improvement_focus = "deepen"
+    elif "accuracy" in regeneration_reason.lower():
+        improvement_focus = "accuracy"
+    
+    self.update_progress(
+        task_id, 
+        20.0, 
+        GenerationPhase.CONTENT, 
+        "PT80S",
+        metadata={"improvement_focus": improvement_focus}
+    )
+    
+    # Generate improved content (60%)
+    regenerated_chapter = {
+        "id": chapter_id,
+        "title": f"Improved Chapter - {course_context.get('title', 'Course')}",
+        "learning_objectives": [
+            "Improved learning objective 1",
+            "Enhanced learning objective 2"
+        ],
+        "content_outline": f"Regenerated content outline based on: {regeneration_reason}",
+        "subchapters": [
+            {
+                "id": str(uuid4()),
+                "sequence_number": 1,
+                "title": "Improved Introduction",
+                "content_type": "mixed",
+                "content_blocks": [
+                    {
+                        "type": "text",
+                        "content": f"Improved content addressing: {regeneration_reason}",
+                        "order": 1,
+                        "metadata": {"improvement_focus": improvement_focus}
+                    }
+                ],
+                "key_concepts": ["Improved concept 1", "Enhanced concept 2"]
             }
+        ],
+        "regeneration_metadata": {
+            "task_id": task_id,
+            "original_chapter_id": chapter_id,
+            "regeneration_reason": regeneration_reason,
+            "improvement_focus": improvement_focus,
+            "regeneration_time": datetime.utcnow(),
+            "options": regeneration_options or {}
         }
-        
-        # Progress through regeneration
-        for progress in [40.0, 60.0, 80.0]:
-            self.update_progress(task_id, progress, GenerationPhase.CONTENT, "PT60S")
-            time.sleep(0.5)
-        
-        # Final validation (20%)
-        self.update_progress(task_id, 90.0, GenerationPhase.VALIDATION, "PT10S")
-        
-        # Add quality improvements
-        regenerated_chapter["quality_improvements"] = {
-            "readability_improvement": 15.0,
-            "pedagogical_alignment_improvement": 0.08,
-            "content_accuracy_improvement": 0.12
-        }
-        
-        self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
-        
-        logger.info(f"Chapter regeneration completed for chapter {chapter_id}")
-        return regenerated_chapter
-        
-    except Exception as exc:
-        self.handle_error(task_id, exc)
-        
-        if self.request.retries < self.max_retries:
-            logger.warning(f"Retrying chapter regeneration for chapter {chapter_id}")
-            raise self.retry(countdown=30 * (2 ** self.request.retries), exc=exc)
-        
-        raise exc
+    }
+    
+    # Progress through regeneration
+    for progress in [40.0, 60.0, 80.0]:
+        self.update_progress(task_id, progress, GenerationPhase.CONTENT, "PT60S")
+        self.flush_progress(task_id)
+        time.sleep(0.5)
+    
+    # Final validation (20%)
+    self.update_progress(task_id, 90.0, GenerationPhase.VALIDATION, "PT10S")
+    
+    # Add quality improvements
+    regenerated_chapter["quality_improvements"] = {
+        "readability_improvement": 15.0,
+        "pedagogical_alignment_improvement": 0.08,
+        "content_accuracy_improvement": 0.12
+    }
+    
+    self.update_progress(task_id, 100.0, GenerationPhase.VALIDATION, "PT0S")
+    
+    logger.info(f"Chapter regeneration completed for chapter {chapter_id}")
+    return regenerated_chapter
 
 
 # Task status monitoring utilities
@@ -747,9 +1014,13 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
         Task status and progress data
     """
     try:
-        result = celery_app.AsyncResult(task_id)
+        # One backend read; AsyncResult.state and .info each re-fetch the
+        # meta until the task reaches a ready state
+        meta = celery_app.AsyncResult(task_id)._get_task_meta()
+        state = meta["status"]
+        info = meta.get("result")
         
-        if result.state == "PENDING":
+        if state == "PENDING":
             return {
                 "task_id": task_id,
                 "status": "pending",
@@ -757,32 +1028,32 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
                 "current_phase": "structure",
                 "estimated_time_remaining": "PT0S"
             }
-        elif result.state == "PROGRESS":
-            return result.info
-        elif result.state == "SUCCESS":
+        elif state == "PROGRESS":
+            return info
+        elif state == "SUCCESS":
             return {
                 "task_id": task_id,
                 "status": "completed",
                 "progress_percentage": 100.0,
                 "current_phase": "validation",
                 "estimated_time_remaining": "PT0S",
-                "result": result.result
+                "result": info
             }
-        elif result.state == "FAILURE":
-            error_info = result.info or {}
+        elif state == "FAILURE":
+            error_info = get_failure_details(celery_app.backend, task_id)
             return {
                 "task_id": task_id,
                 "status": "failed",
                 "progress_percentage": 0.0,
                 "current_phase": "structure",
                 "estimated_time_remaining": "PT0S",
-                "error_details": str(result.info) if result.info else "Unknown error",
+                "error_details": str(info) if info else "Unknown error",
                 "retry_count": error_info.get("retry_count", 0)
             }
         else:
             return {
                 "task_id": task_id,
-                "status": result.state.lower(),
+                "status": state.lower(),
                 "progress_percentage": 0.0,
                 "current_phase": "structure",
                 "estimated_time_remaining": "PT0S"
@@ -5,24 +5,160 @@ Provides helper functions for task status tracking, progress monitoring,
 and task lifecycle management.
 """
 
+import functools
 import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-from uuid import UUID
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from uuid import UUID, uuid4
 
-from celery.result import AsyncResult
+from celery import states
 
 from .celery_app import celery_app
-from .generation_tasks import TaskStatus, GenerationPhase
+from .generation_tasks import (
+    GenerationPhase,
+    TaskStatus,
+    course_generation_chord,
+    export_course_task,
+    generate_chapter_task,
+    generate_course_task,
+    get_failure_details,
+    regenerate_chapter_task,
+    validate_quality_task,
+)
 
 logger = logging.getLogger(__name__)
 
+# Runs inspect broadcasts side by side; each waits up to its timeout for
+# worker replies, so issuing them in turn multiplies the wait
+_INSPECT_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="celery-inspect")
+
+# (stats, active, reserved) inspect replies, keyed by worker name
+InspectSnapshot = Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]
+
+
+# Status reported before any progress; copied per request (task_id and
+# metadata are filled in, since copies share values)
+_BASE_STATUS_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    "task_id": None,
+    "status": "pending",
+    "progress_percentage": 0.0,
+    "current_phase": "structure",
+    "estimated_time_remaining": "PT0S",
+    "start_time": None,
+    "last_update": None,
+    "error_details": None,
+    "retry_count": 0,
+    "metadata": None,
+})
+
+
+class TaskStatusCache:
+    """
+    In-process cache of task result meta, fed by the result backend.
+    
+    The Redis result backend publishes every stored state (progress, retry,
+    success, failure) on the task's meta key. One listener thread subscribes
+    to all of them, so status reads are dictionary lookups instead of a
+    Redis GET per poll. Entries are evicted least recently used first.
+    """
+    
+    def __init__(self, backend, max_size: int = 100_000):
+        self._backend = backend
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._listener: Optional[threading.Thread] = None
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether the backend publishes state changes (Redis only)."""
+        client = getattr(self._backend, "client", None)
+        return client is not None and hasattr(client, "pubsub")
+    
+    def start(self) -> None:
+        """Start the listener thread if it is not already running."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(
+                    target=self._listen, name="task-status-cache", daemon=True
+                )
+                self._listener.start()
+    
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Get the last published meta for a task, if seen."""
+        with self._lock:
+            meta = self._entries.get(task_id)
+            if meta is not None:
+                self._entries.move_to_end(task_id)
+            return meta
+    
+    def put(self, task_id: str, meta: Dict[str, Any]) -> None:
+        """Store task meta, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[task_id] = meta
+            self._entries.move_to_end(task_id)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+    
+    def _listen(self) -> None:
+        prefix = self._backend.task_keyprefix
+        if isinstance(prefix, str):
+            prefix = prefix.encode()
+        delay = 1.0
+        while True:
+            pubsub = self._backend.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.psubscribe(prefix + b"*")
+                delay = 1.0
+                for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    task_id = message["channel"][len(prefix):].decode()
+                    self.put(task_id, self._backend.decode_result(message["data"]))
+            except Exception as exc:
+                logger.warning("Task status listener disconnected: %s", exc)
+            finally:
+                pubsub.close()
+            
+            # States published while disconnected were missed
+            with self._lock:
+                self._entries.clear()
+            time.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
 
 class TaskManager:
     """Manager class for task operations and monitoring."""
     
     def __init__(self):
         self.app = celery_app
+        # Resolve the result backend once and share it, with its connection
+        # pool, across threads; app.backend is otherwise built per thread
+        self._backend = self.app.backend
+        self._AsyncResult = self.app.AsyncResult
+        # Started on the first status read, so workers importing this
+        # module never run the listener
+        self._status_cache = TaskStatusCache(self._backend)
+        # Broadcasts borrow broker connections from the app's pool (sized by
+        # broker_pool_limit), so one Inspect serves every call and thread
+        self._inspect = self.app.control.inspect()
+        # Bound enqueue methods per task type; apply_async directly, since
+        # delay() only repacks its arguments for it. Queues and priorities
+        # come from the task routes
+        self._send = {
+            "course": generate_course_task.apply_async,
+            "chapter": generate_chapter_task.apply_async,
+            "quality": validate_quality_task.apply_async,
+            "export": export_course_task.apply_async,
+            "regeneration": regenerate_chapter_task.apply_async,
+        }
     
     def start_course_generation(
         self, 
@@ -39,11 +175,9 @@ class TaskManager:
         Returns:
             Task ID for monitoring
         """
-        from .generation_tasks import generate_course_task
-        
-        task = generate_course_task.delay(course_data, user_preferences)
+        task = self._send["course"](args=(course_data, user_preferences))
         
-        logger.info(f"Started course generation task {task.id} for course {course_data.get('id')}")
+        logger.info("Started course generation task %s for course %s", task.id, course_data.get("id"))
         return task.id
     
     def start_chapter_generation(
@@ -61,13 +195,42 @@ class TaskManager:
         Returns:
             Task ID for monitoring
         """
-        from .generation_tasks import generate_chapter_task
+        task = self._send["chapter"](args=(chapter_data, course_context))
         
-        task = generate_chapter_task.delay(chapter_data, course_context)
-        
-        logger.info(f"Started chapter generation task {task.id} for chapter {chapter_data.get('id')}")
+        logger.info("Started chapter generation task %s for chapter %s", task.id, chapter_data.get("id"))
         return task.id
     
+    def start_course_with_chapters(
+        self,
+        course_data: Dict[str, Any],
+        chapter_data_list: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Start generation of a course whose chapters are already planned.
+        
+        Chapters are published as one chord and generated in parallel;
+        the assembly callback produces the course.
+        
+        Args:
+            course_data: Course creation data
+            chapter_data_list: Chapter creation data, in course order
+            
+        Returns:
+            Task ID of the assembly step, for monitoring
+        """
+        course_context = {**course_data, "id": course_data.get("id") or str(uuid4())}
+        result = course_generation_chord(
+            chapter_data_list,
+            course_context,
+            datetime.utcnow().isoformat()
+        ).apply_async()
+        
+        logger.info(
+            "Started course generation task %s for course %s with %d chapters",
+            result.id, course_context["id"], len(chapter_data_list)
+        )
+        return result.id
+    
     def start_quality_validation(
         self,
         content_data: Dict[str, Any],
@@ -83,11 +246,9 @@ class TaskManager:
         Returns:
             Task ID for monitoring
         """
-        from .generation_tasks import validate_quality_task
+        task = self._send["quality"](args=(content_data, validation_criteria))
         
-        task = validate_quality_task.delay(content_data, validation_criteria)
-        
-        logger.info(f"Started quality validation task {task.id}")
+        logger.info("Started quality validation task %s", task.id)
         return task.id
     
     def start_course_export(
@@ -107,11 +268,12 @@ class TaskManager:
         Returns:
             Task ID for monitoring
         """
-        from .generation_tasks import export_course_task
-        
-        task = export_course_task.delay(course_data, export_format, export_options)
+        task = self._send["export"](args=(course_data, export_format, export_options))
         
-        logger.info(f"Started export task {task.id} for course {course_data.get('id')} to {export_format}")
+        logger.info(
+            "Started export task %s for course %s to %s",
+            task.id, course_data.get("id"), export_format
+        )
         return task.id
     
     def start_chapter_regeneration(
@@ -133,18 +295,35 @@ class TaskManager:
         Returns:
             Task ID for monitoring
         """
-        from .generation_tasks import regenerate_chapter_task
-        
-        task = regenerate_chapter_task.delay(
-            chapter_id, 
-            course_context, 
+        task = self._send["regeneration"](args=(
+            chapter_id,
+            course_context,
             regeneration_reason,
             regeneration_options
-        )
+        ))
         
-        logger.info(f"Started chapter regeneration task {task.id} for chapter {chapter_id}")
+        logger.info("Started chapter regeneration task %s for chapter %s", task.id, chapter_id)
         return task.id
     
+    def _get_task_meta(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get task result meta, from the status cache when it has the task.
+        
+        Misses read the backend once; finished states are cached since no
+        further state is published for them.
+        """
+        cache = self._status_cache
+        if cache.enabled:
+            cache.start()
+            meta = cache.get(task_id)
+            if meta is not None:
+                return meta
+        
+        meta = self._AsyncResult(task_id, backend=self._backend)._get_task_meta()
+        if meta["status"] in states.READY_STATES:
+            cache.put(task_id, meta)
+        return meta
+    
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
         Get comprehensive task status.
@@ -156,59 +335,49 @@ class TaskManager:
             Task status information
         """
         try:
-            result = AsyncResult(task_id, app=self.app)
+            meta = self._get_task_meta(task_id)
+            state = meta["status"]
+            info = meta.get("result")
             
-            base_status = {
-                "task_id": task_id,
-                "status": "pending",
-                "progress_percentage": 0.0,
-                "current_phase": "structure",
-                "estimated_time_remaining": "PT0S",
-                "start_time": None,
-                "last_update": None,
-                "error_details": None,
-                "retry_count": 0,
-                "metadata": {}
-            }
+            base_status = _BASE_STATUS_TEMPLATE.copy()
+            base_status["task_id"] = task_id
+            base_status["metadata"] = {}
             
-            if result.state == "PENDING":
-                base_status.update({
-                    "status": "pending"
-                })
-            elif result.state == "PROGRESS":
-                if isinstance(result.info, dict):
-                    base_status.update(result.info)
+            if state == "PROGRESS":
+                if isinstance(info, dict):
+                    base_status |= info
                     base_status["status"] = "in_progress"
-            elif result.state == "SUCCESS":
-                base_status.update({
+            elif state == "SUCCESS":
+                base_status |= {
                     "status": "completed",
                     "progress_percentage": 100.0,
                     "current_phase": "validation",
-                    "estimated_time_remaining": "PT0S"
-                })
-                if hasattr(result, 'result') and result.result:
-                    base_status["result"] = result.result
-            elif result.state == "FAILURE":
-                error_info = result.info if isinstance(result.info, dict) else {}
-                base_status.update({
+                }
+                if info:
+                    base_status["result"] = info
+            elif state == "FAILURE":
+                # Kept on the meta, which the status cache holds, so polls of
+                # a failed task read the stored fields once
+                error_info = meta.get("failure_details")
+                if error_info is None:
+                    error_info = meta["failure_details"] = get_failure_details(
+                        self._backend, task_id
+                    )
+                base_status |= {
                     "status": "failed",
-                    "error_details": str(result.info) if result.info else "Unknown error",
+                    "error_details": str(info) if info else "Unknown error",
                     "retry_count": error_info.get("retry_count", 0)
-                })
-            elif result.state == "RETRY":
-                base_status.update({
-                    "status": "retrying",
-                    "retry_count": getattr(result, 'retries', 0)
-                })
-            else:
-                base_status.update({
-                    "status": result.state.lower()
-                })
+                }
+            elif state == "RETRY":
+                base_status["status"] = "retrying"
+                base_status["retry_count"] = meta.get("retries") or 0
+            elif state != "PENDING":
+                base_status["status"] = state.lower()
             
             return base_status
             
         except Exception as exc:
-            logger.error(f"Error getting task status for {task_id}: {exc}")
+            logger.error("Error getting task status for %s: %s", task_id, exc)
             return {
                 "task_id": task_id,
                 "status": "failed",
@@ -231,64 +400,91 @@ class TaskManager:
         """
         try:
             self.app.control.revoke(task_id, terminate=True)
-            logger.info(f"Cancelled task {task_id}: {reason}")
+            logger.info("Cancelled task %s: %s", task_id, reason)
             return True
         except Exception as exc:
-            logger.error(f"Failed to cancel task {task_id}: {exc}")
+            logger.error("Failed to cancel task %s: %s", task_id, exc)
             return False
     
-    def get_active_tasks(self, task_types: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def get_active_tasks(
+        self,
+        task_types: Optional[List[str]] = None,
+        snapshot: Optional[InspectSnapshot] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get list of active tasks.
         
         Args:
             task_types: Filter by task types (optional)
+            snapshot: Result of _inspect_snapshot() to reuse instead of
+                broadcasting again (optional)
             
         Returns:
             List of active task information
         """
         try:
-            active_tasks = []
-            inspect = self.app.control.inspect()
-            
             # Get active tasks from all workers
-            active = inspect.active()
-            if active:
-                for worker, tasks in active.items():
-                    for task in tasks:
-                        task_info = {
-                            "task_id": task["id"],
-                            "task_name": task["name"],
-                            "worker": worker,
-                            "args": task.get("args", []),
-                            "kwargs": task.get("kwargs", {}),
-                            "time_start": task.get("time_start")
-                        }
-                        
-                        # Filter by task types if specified
-                        if not task_types or any(t in task["name"] for t in task_types):
-                            active_tasks.append(task_info)
+            if snapshot is not None:
+                active = snapshot[1]
+            else:
+                active = self._inspect.active()
+            if not active:
+                return []
             
-            return active_tasks
+            entries = (
+                (worker, task) for worker, tasks in active.items() for task in tasks
+            )
+            # Filter by task types if specified, before building the entries
+            if task_types:
+                entries = (
+                    (worker, task) for worker, task in entries
+                    if any(t in task["name"] for t in task_types)
+                )
+            
+            return [
+                {
+                    "task_id": task["id"],
+                    "task_name": task["name"],
+                    "worker": worker,
+                    "args": task.get("args", []),
+                    "kwargs": task.get("kwargs", {}),
+                    "time_start": task.get("time_start")
+                }
+                for worker, task in entries
+            ]
             
         except Exception as exc:
-            logger.error(f"Error getting active tasks: {exc}")
+            logger.error("Error getting active tasks: %s", exc)
             return []
     
-    def get_worker_stats(self) -> Dict[str, Any]:
+    def _inspect_snapshot(self) -> InspectSnapshot:
+        """
+        Fetch worker stats, active and reserved tasks in concurrent broadcasts.
+        
+        Returns:
+            (stats, active, reserved) keyed by worker name
+        """
+        inspect = self._inspect
+        futures = [
+            _INSPECT_EXECUTOR.submit(command)
+            for command in (inspect.stats, inspect.active, inspect.reserved)
+        ]
+        stats, active, reserved = (future.result() or {} for future in futures)
+        return stats, active, reserved
+    
+    def get_worker_stats(self, snapshot: Optional[InspectSnapshot] = None) -> Dict[str, Any]:
         """
         Get worker statistics and health information.
         
+        Args:
+            snapshot: Result of _inspect_snapshot() to reuse instead of
+                broadcasting again (optional)
+        
         Returns:
             Worker statistics
         """
         try:
-            inspect = self.app.control.inspect()
-            
-            # Get basic stats
-            stats = inspect.stats() or {}
-            active = inspect.active() or {}
-            reserved = inspect.reserved() or {}
+            stats, active, reserved = snapshot or self._inspect_snapshot()
             
             worker_info = {}
             for worker in stats.keys():
@@ -310,10 +506,38 @@ class TaskManager:
             }
             
         except Exception as exc:
-            logger.error(f"Error getting worker stats: {exc}")
+            logger.error("Error getting worker stats: %s", exc)
             return {"error": str(exc)}
 
 
+# Base completion time per task type, in seconds
+_BASE_TIMES: Mapping[str, int] = MappingProxyType({
+    "generate_course": 600,  # 10 minutes base
+    "generate_chapter": 120,  # 2 minutes base
+    "validate_quality": 300,  # 5 minutes base
+    "export_course": 180,  # 3 minutes base
+    "regenerate_chapter": 120  # 2 minutes base
+})
+_DEFAULT_BASE_TIME = 300
+
+# Target audience complexity
+_LEVEL_MULTIPLIERS: Mapping[str, float] = MappingProxyType({
+    "beginner": 1.2,  # More detailed explanations
+    "intermediate": 1.0,
+    "advanced": 1.1,
+    "expert": 1.3  # More sophisticated content
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso_duration(seconds: int) -> str:
+    """Format whole seconds as an ISO 8601 duration (minutes and seconds)."""
+    minutes, seconds = divmod(seconds, 60)
+    if minutes > 0:
+        return f"PT{minutes}M{seconds}S" if seconds > 0 else f"PT{minutes}M"
+    return f"PT{seconds}S"
+
+
 def estimate_completion_time(
     task_type: str,
     complexity_factors: Optional[Dict[str, Any]] = None
@@ -328,15 +552,7 @@ def estimate_completion_time(
     Returns:
         ISO 8601 duration estimate
     """
-    base_times = {
-        "generate_course": 600,  # 10 minutes base
-        "generate_chapter": 120,  # 2 minutes base
-        "validate_quality": 300,  # 5 minutes base
-        "export_course": 180,  # 3 minutes base
-        "regenerate_chapter": 120  # 2 minutes base
-    }
-    
-    base_time = base_times.get(task_type, 300)
+    base_time = _BASE_TIMES.get(task_type, _DEFAULT_BASE_TIME)
     
     # Apply complexity multipliers
     if complexity_factors:
@@ -350,26 +566,12 @@ def estimate_completion_time(
         if "difficulty_score" in complexity_factors:
             multiplier *= max(0.8, complexity_factors["difficulty_score"] / 3.0)
         
-        # Target audience complexity
         if "proficiency_level" in complexity_factors:
-            level_multipliers = {
-                "beginner": 1.2,  # More detailed explanations
-                "intermediate": 1.0,
-                "advanced": 1.1,
-                "expert": 1.3  # More sophisticated content
-            }
-            multiplier *= level_multipliers.get(complexity_factors["proficiency_level"], 1.0)
+            multiplier *= _LEVEL_MULTIPLIERS.get(complexity_factors["proficiency_level"], 1.0)
         
         base_time = int(base_time * multiplier)
     
-    # Convert to ISO 8601 duration
-    minutes = base_time // 60
-    seconds = base_time % 60
-    
-    if minutes > 0:
-        return f"PT{minutes}M{seconds}S" if seconds > 0 else f"PT{minutes}M"
-    else:
-        return f"PT{seconds}S"
+    return _iso_duration(base_time)
 
 
 def get_task_queue_status() -> Dict[str, Any]:
@@ -380,23 +582,24 @@ def get_task_queue_status() -> Dict[str, Any]:
         Queue status information
     """
     try:
-        task_manager = TaskManager()
+        # One set of broadcasts serves both the task list and worker stats
+        snapshot = task_manager._inspect_snapshot()
         
         # Get active tasks by type
-        active_tasks = task_manager.get_active_tasks()
+        active_tasks = task_manager.get_active_tasks(snapshot=snapshot)
         
-        task_counts = {}
-        for task in active_tasks:
-            task_name = task["task_name"].split(".")[-1]  # Get last part of task name
-            task_counts[task_name] = task_counts.get(task_name, 0) + 1
+        # Count by the last part of the task name
+        task_counts = Counter(
+            task["task_name"].rpartition(".")[2] for task in active_tasks
+        )
         
         # Get worker stats
-        worker_stats = task_manager.get_worker_stats()
+        worker_stats = task_manager.get_worker_stats(snapshot)
         
         return {
             "queue_health": "healthy" if worker_stats.get("total_workers", 0) > 0 else "unhealthy",
             "total_active_tasks": len(active_tasks),
-            "tasks_by_type": task_counts,
+            "tasks_by_type": dict(task_counts),
             "worker_stats": worker_stats,
             "queue_capacity": {
                 "max_concurrent_courses": 100,  # As per FR-022
@@ -412,7 +615,7 @@ def get_task_queue_status() -> Dict[str, Any]:
         }
         
     except Exception as exc:
-        logger.error(f"Error getting queue status: {exc}")
+        logger.error("Error getting queue status: %s", exc)
         return {
             "queue_health": "unhealthy",
             "error": str(exc)
@@ -9,13 +9,21 @@ import os
 import sys
 import logging
 from pathlib import Path
+from typing import List, Optional
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(src_path))
 
 from .celery_app import celery_app
-from .config import get_celery_config, get_performance_settings
+from .config import (
+    WORKER_QUEUE_GROUPS,
+    get_celery_config,
+    get_performance_settings,
+    get_prefetch_multiplier,
+    get_routed_queues,
+    get_worker_pool,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -25,55 +33,113 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def configure_worker():
-    """Configure the Celery worker for course generation."""
+# Queues consumed when no queue list is given: everything the task routes
+# can send to
+DEFAULT_QUEUES = get_routed_queues()
+
+
+# Entry point for gevent workers: patches before the src.tasks package (and
+# with it Celery, kombu, redis, ssl and logging) is first imported, which
+# ``python -m src.tasks.worker`` does before this module runs
+_GEVENT_ENTRY = (
+    "from gevent import monkey; monkey.patch_all(); "
+    "import runpy; runpy.run_module(%r, run_name='__main__', alter_sys=True)"
+)
+
+
+def _gevent_patched() -> bool:
+    """Whether gevent has monkey-patched this process."""
+    monkey = sys.modules.get("gevent.monkey")
+    return monkey is not None and monkey.is_module_patched("socket")
+
+
+def configure_worker(queues: Optional[List[str]] = None):
+    """
+    Configure the Celery worker for course generation.
+    
+    Args:
+        queues: Queues the worker will consume; a worker dedicated to
+            long-task queues reserves one message per process
+    """
     environment = os.getenv("ENVIRONMENT", "development")
     config = get_celery_config(environment)
     
+    # Prefetch is set in the app configuration rather than on the command
+    # line so inspect/Flower report the value the worker actually uses
+    if queues:
+        config["worker_prefetch_multiplier"] = get_prefetch_multiplier(queues)
+    
     # Apply configuration to Celery app
     celery_app.conf.update(config)
     
-    logger.info(f"Configured Celery worker for {environment} environment")
+    logger.info("Configured Celery worker for %s environment", environment)
     return celery_app
 
 
-def start_worker():
-    """Start the Celery worker with optimized settings."""
-    app = configure_worker()
+def start_worker(
+    concurrency: Optional[int] = None,
+    queues: Optional[List[str]] = None,
+    pool: Optional[str] = None
+):
+    """
+    Start the Celery worker with optimized settings.
+    
+    Args:
+        concurrency: Worker pool size (defaults to the performance settings,
+            which read CELERY_WORKER_CONCURRENCY once at import)
+        queues: Queues to consume (defaults to DEFAULT_QUEUES). Run separate
+            workers for long-task queues so short tasks are never reserved
+            behind a course generation
+        pool: Execution pool (defaults to the queues' pool, see
+            get_worker_pool); gevent and threads suit the IO-bound LLM calls.
+            gevent must already be patched at process entry, as the command
+            line does
+    """
+    queues = queues or DEFAULT_QUEUES
+    pool = pool or get_worker_pool(queues)
+    if pool == "gevent" and not _gevent_patched():
+        raise RuntimeError(
+            "The gevent pool must be patched before Celery is imported; start "
+            "the worker from the command line or with celery worker -P gevent"
+        )
+    
+    app = configure_worker(queues)
     
     # Get performance settings
     perf_settings = get_performance_settings()
     
+    if pool == "gevent":
+        concurrency = concurrency or perf_settings['gevent_concurrency']
+    concurrency = concurrency or perf_settings['worker_pool_size']
+    
     # Worker arguments
     worker_args = [
         "worker",
         "--loglevel=INFO",
-        f"--concurrency={perf_settings['worker_pool_size']}",
-        f"--prefetch-multiplier={perf_settings['prefetch_multiplier']}",
+        f"--pool={pool}",
+        f"--concurrency={concurrency}",
         f"--max-tasks-per-child={perf_settings['max_tasks_per_child']}",
+        f"--max-memory-per-child={perf_settings['worker_max_memory_per_child']}",
         "--time-limit=660",  # 11 minutes (allows for course generation)
         "--soft-time-limit=600",  # 10 minutes soft limit
     ]
-    
-    # Queue configuration
-    queues = [
-        "course_generation",
-        "chapter_generation", 
-        "quality_validation",
-        "export",
-        "default"
-    ]
     worker_args.extend([f"--queues={','.join(queues)}"])
     
     # Performance optimizations
     worker_args.extend([
         "--optimization=fair",
         "--without-gossip",
-        "--without-mingle",
-        "--without-heartbeat"
     ])
+    if os.getenv("CELERY_SINGLE_WORKER", "").lower() in ("1", "true"):
+        # Heartbeats let other workers and monitors notice a dead worker,
+        # and mingle syncs revoked tasks at startup; a lone worker needs
+        # neither
+        worker_args.extend([
+            "--without-mingle",
+            "--without-heartbeat"
+        ])
     
-    logger.info(f"Starting Celery worker with args: {' '.join(worker_args)}")
+    logger.info("Starting Celery worker with args: %s", " ".join(worker_args))
     
     # Start worker
     app.worker_main(worker_args)
@@ -124,14 +190,25 @@ if __name__ == "__main__":
     )
     parser.add_argument(
         "--queues",
-        default="course_generation,chapter_generation,quality_validation,export,default",
-        help="Comma-separated list of queues to process"
+        help="Comma-separated list of queues to process (defaults to every "
+             "routed queue)"
+    )
+    parser.add_argument(
+        "--queue-group",
+        choices=sorted(WORKER_QUEUE_GROUPS),
+        help="Dedicated worker group (sets queues and concurrency)"
     )
     parser.add_argument(
         "--concurrency",
         type=int,
-        default=4,
-        help="Number of concurrent worker processes"
+        default=None,
+        help="Number of concurrent worker processes (defaults to the "
+             "queue group or performance settings)"
+    )
+    parser.add_argument(
+        "--pool",
+        choices=["prefork", "gevent", "threads"],
+        help="Execution pool (defaults to the pool configured for the queues)"
     )
     parser.add_argument(
         "--loglevel",
@@ -146,11 +223,26 @@ if __name__ == "__main__":
     os.environ["ENVIRONMENT"] = args.environment
     
     if args.command == "worker":
+        queues = args.queues.split(",") if args.queues else None
+        concurrency = args.concurrency
+        if args.queue_group:
+            group = WORKER_QUEUE_GROUPS[args.queue_group]
+            queues = list(group.queues)
+            concurrency = concurrency or group.concurrency
+        
+        pool = args.pool or get_worker_pool(queues or DEFAULT_QUEUES)
+        if pool == "gevent" and not _gevent_patched():
+            # Too late to patch this process; rerun through the entry point
+            # that patches before anything else is imported
+            os.execv(sys.executable, [
+                sys.executable, "-c", _GEVENT_ENTRY % __spec__.name, *sys.argv[1:]
+            ])
+        
         # Override worker settings if specified
-        if args.concurrency:
-            os.environ["CELERY_WORKER_CONCURRENCY"] = str(args.concurrency)
+        if concurrency:
+            os.environ["CELERY_WORKER_CONCURRENCY"] = str(concurrency)
         
-        start_worker()
+        start_worker(concurrency=concurrency, queues=queues, pool=pool)
         
     elif args.command == "beat":
         start_beat()
@@ -4,20 +4,20 @@ Script de test pour la création de cours
 Course Platform API - Test de création et validation
 """
 
-import requests
-import json
-import time
-from datetime import datetime
+import asyncio
+
+import httpx
+import orjson
 
 API_BASE_URL = "http://localhost:8083"
 
-def test_api_health():
+async def test_api_health(client):
     """Test de santé de l'API"""
     print("🔍 Test de santé de l'API...")
     try:
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = await client.get("/health")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ API Status: {data.get('status')}")
             print(f"   ✅ Database: {data.get('database')}")
             return True
@@ -28,18 +28,16 @@ def test_api_health():
         print(f"   ❌ Erreur de connexion: {e}")
         return False
 
-def create_course(course_data):
+async def create_course(client, course_data):
     """Créer un nouveau cours"""
-    print(f"\n📝 Création du cours: {course_data['title']}")
     try:
-        response = requests.post(
-            f"{API_BASE_URL}/api/v1/courses",
-            headers={"Content-Type": "application/json"},
-            json=course_data
-        )
+        response = await client.post("/api/v1/courses", json=course_data)
         
+        # Les créations tournent en parallèle : on n'affiche qu'une fois la
+        # réponse reçue pour que les lignes de chaque cours restent groupées
+        print(f"\n📝 Création du cours: {course_data['title']}")
         if response.status_code == 201:
-            data = response.json()
+            data = orjson.loads(response.content)
             course_id = data.get('course_id')
             print(f"   ✅ Cours créé avec succès")
             print(f"   📋 ID: {course_id}")
@@ -50,16 +48,17 @@ def create_course(course_data):
             print(f"   📋 Réponse: {response.text}")
             return None
     except Exception as e:
+        print(f"\n📝 Création du cours: {course_data['title']}")
         print(f"   ❌ Erreur: {e}")
         return None
 
-def get_course_list():
+async def get_course_list(client):
     """Récupérer la liste des cours"""
     print(f"\n📋 Récupération de la liste des cours...")
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/courses")
+        response = await client.get("/api/v1/courses")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             courses = data.get('courses', [])
             pagination = data.get('pagination', {})
             
@@ -77,13 +76,13 @@ def get_course_list():
         print(f"   ❌ Erreur: {e}")
         return []
 
-def get_course_details(course_id):
+async def get_course_details(client, course_id):
     """Récupérer les détails d'un cours"""
     print(f"\n🔍 Récupération des détails du cours {course_id}")
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/courses/{course_id}")
+        response = await client.get(f"/api/v1/courses/{course_id}")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ Cours trouvé: {data.get('title')}")
             print(f"   📋 Description: {data.get('description')}")
             print(f"   📋 Status: {data.get('status')}")
@@ -98,13 +97,13 @@ def get_course_details(course_id):
         print(f"   ❌ Erreur: {e}")
         return None
 
-def test_generation_status(course_id):
+async def test_generation_status(client, course_id):
     """Tester le statut de génération"""
     print(f"\n⚡ Test du statut de génération pour {course_id}")
     try:
-        response = requests.get(f"{API_BASE_URL}/api/v1/courses/{course_id}/generation-status")
+        response = await client.get(f"/api/v1/courses/{course_id}/generation-status")
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"   ✅ Status: {data.get('status')}")
             print(f"   📊 Progrès: {data.get('progress')}%")
             print(f"   📋 Chapitres: {data.get('chapters_generated')}/{data.get('total_chapters')}")
@@ -116,13 +115,19 @@ def test_generation_status(course_id):
         print(f"   ❌ Erreur: {e}")
         return None
 
-def main():
+async def main():
     """Fonction principale de test"""
     print("🎯 TEST COMPLET DE CRÉATION DE COURS")
     print("=" * 50)
     
+    # Un seul client : les connexions restent ouvertes d'une requête à l'autre
+    async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=10.0) as client:
+        await run_scenario(client)
+
+async def run_scenario(client):
+    """Enchaîne les tests sur un client déjà ouvert"""
     # Test de santé
-    if not test_api_health():
+    if not await test_api_health(client):
         print("❌ L'API n'est pas disponible. Arrêt des tests.")
         return
     
@@ -154,26 +159,23 @@ def main():
         }
     ]
     
-    created_courses = []
-    
-    # Créer les cours
-    for course_data in courses_to_test:
-        course_id = create_course(course_data)
-        if course_id:
-            created_courses.append({
-                "id": course_id,
-                "title": course_data["title"]
-            })
-        time.sleep(1)  # Délai entre les créations
+    # Créer les cours en parallèle
+    course_ids = await asyncio.gather(
+        *(create_course(client, course_data) for course_data in courses_to_test)
+    )
+    created_courses = [
+        {"id": course_id, "title": course_data["title"]}
+        for course_id, course_data in zip(course_ids, courses_to_test)
+        if course_id
+    ]
     
     # Lister tous les cours
-    get_course_list()
+    await get_course_list(client)
     
     # Tester les détails et statut de génération pour chaque cours créé
     for course in created_courses:
-        get_course_details(course["id"])
-        test_generation_status(course["id"])
-        time.sleep(0.5)
+        await get_course_details(client, course["id"])
+        await test_generation_status(client, course["id"])
     
     # Résumé
     print(f"\n🎉 RÉSUMÉ DES TESTS")
@@ -187,4 +189,4 @@ def main():
             print(f"   - {course['title']}: {course['id']}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
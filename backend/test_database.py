@@ -15,7 +15,7 @@ def test_database_connection():
     print("🔍 Test de connexion à la base de données...")
     
     try:
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
         from dotenv import load_dotenv
         
         # Load environment variables
@@ -28,29 +28,24 @@ def test_database_connection():
             
         print(f"🔗 Connexion à: {database_url}")
         
-        # Create engine
-        engine = create_engine(database_url)
+        # Shared pooled engine, read from DATABASE_URL once loaded; the
+        # session in the models test reuses its connections
+        from database import engine
         
         # Test connection
+        # Version, public tables and course count in a single round trip
         with engine.connect() as conn:
-            result = conn.execute(text("SELECT version()"))
-            version = result.fetchone()[0]
+            version, tables, course_count = conn.execute(text("""
+                SELECT 
+                    (SELECT version()),
+                    (SELECT string_agg(table_name, ', ' ORDER BY table_name) 
+                     FROM information_schema.tables 
+                     WHERE table_schema = 'public'),
+                    (SELECT COUNT(*) FROM courses)
+            """)).one()
             print(f"✅ Connexion réussie!")
             print(f"✅ Version PostgreSQL: {version}")
-            
-            # Test tables exist
-            result = conn.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                ORDER BY table_name
-            """))
-            tables = [row[0] for row in result.fetchall()]
-            print(f"✅ Tables trouvées: {', '.join(tables)}")
-            
-            # Test we can query tables
-            result = conn.execute(text("SELECT COUNT(*) FROM courses"))
-            course_count = result.fetchone()[0]
+            print(f"✅ Tables trouvées: {tables or ''}")
             print(f"✅ Nombre de cours: {course_count}")
             
             return True
@@ -89,49 +84,32 @@ def test_api_with_database():
     try:
         import asyncio
         import httpx
-        import subprocess
-        import time
-        
-        # Start API in background
-        print("🚀 Démarrage de l'API...")
+        from main import app
         
-        # Note: En production, utilisez un gestionnaire de processus approprié
-        api_process = subprocess.Popen([
-            sys.executable, "-m", "uvicorn", "main:app", 
-            "--host", "0.0.0.0", "--port", "8001"  # Port différent pour les tests
-        ], cwd="src", stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # The app is served in-process: no uvicorn subprocess, no port and
+        # no startup delay to wait out
+        async def test_endpoints():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                # Test health
+                response = await client.get("/health")
+                if response.status_code == 200:
+                    print("✅ Endpoint /health fonctionne")
+                else:
+                    print(f"⚠️ /health retourne {response.status_code}")
+                
+                # Test courses list (should work now with DB)
+                response = await client.get("/api/v1/courses")
+                if response.status_code == 200:
+                    data = response.json()
+                    print(f"✅ Endpoint /api/v1/courses fonctionne: {data.get('total', 0)} cours")
+                    return True
+                else:
+                    print(f"❌ /api/v1/courses retourne {response.status_code}: {response.text}")
+                    return False
         
-        # Wait for API to start
-        time.sleep(3)
-        
-        try:
-            # Test API endpoints
-            async def test_endpoints():
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    # Test health
-                    response = await client.get("http://localhost:8001/health")
-                    if response.status_code == 200:
-                        print("✅ Endpoint /health fonctionne")
-                    else:
-                        print(f"⚠️ /health retourne {response.status_code}")
-                    
-                    # Test courses list (should work now with DB)
-                    response = await client.get("http://localhost:8001/api/v1/courses")
-                    if response.status_code == 200:
-                        data = response.json()
-                        print(f"✅ Endpoint /api/v1/courses fonctionne: {data.get('total', 0)} cours")
-                        return True
-                    else:
-                        print(f"❌ /api/v1/courses retourne {response.status_code}: {response.text}")
-                        return False
-            
-            # Run async test
-            result = asyncio.run(test_endpoints())
-            
-        finally:
-            # Stop API
-            api_process.terminate()
-            api_process.wait()
+        # Run async test
+        result = asyncio.run(test_endpoints())
             
         return result
         
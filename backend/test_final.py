@@ -36,12 +36,12 @@ def test_complete_setup():
     # Test 2: Database connection
     print("\n2️⃣ Test connexion base de données...")
     try:
-        from sqlalchemy import create_engine, text
+        from sqlalchemy import text
         from dotenv import load_dotenv
         load_dotenv()
         
-        database_url = os.getenv('DATABASE_URL')
-        engine = create_engine(database_url)
+        # Shared pooled engine, configured from DATABASE_URL once loaded
+        from database import engine
         
         with engine.connect() as conn:
             result = conn.execute(text("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'"))
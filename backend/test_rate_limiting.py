@@ -6,6 +6,7 @@ python test_rate_limiting.py
 """
 
 import asyncio
+import statistics
 import time
 import pytest
 from fastapi import FastAPI, Request, Depends
@@ -26,7 +27,8 @@ from middleware.rate_limiting import (
     RateLimitStore,
     AdvancedRateLimiter,
     rate_limit_dependency,
-    RateLimitMiddleware
+    RateLimitMiddleware,
+    _TimestampRing
 )
 
 class TestEndpointClassifier:
@@ -115,6 +117,66 @@ class TestRateLimitStore:
         assert allowed is True
         assert count == 1  # Counter should reset
 
+class TestTimestampRing:
+    """Test the memory store's per-window timestamp ring"""
+    
+    def test_starts_small(self):
+        """A new window does not reserve slots for its whole limit"""
+        ring = _TimestampRing()
+        ring.append(1, 50000)
+        assert len(ring.slots) == _TimestampRing.INITIAL_SLOTS
+        assert list(ring) == [1]
+    
+    def test_expire_drops_oldest(self):
+        """Timestamps at or before the window start are removed"""
+        ring = _TimestampRing()
+        for timestamp in (1, 2, 3, 4):
+            ring.append(timestamp, 10)
+        
+        ring.expire(2)
+        assert list(ring) == [3, 4]
+        assert len(ring) == 2
+        
+        ring.expire(10)
+        assert list(ring) == []
+        assert len(ring) == 0
+    
+    def test_wrap_around(self):
+        """Appends after expiry reuse freed slots at the start of the ring"""
+        ring = _TimestampRing()
+        size = len(ring.slots)
+        for timestamp in range(size):
+            ring.append(timestamp, size)
+        
+        ring.expire(2)
+        for timestamp in range(size, size + 3):
+            ring.append(timestamp, size)
+        
+        assert len(ring.slots) == size
+        assert list(ring) == list(range(3, size + 3))
+    
+    def test_growth_keeps_order(self):
+        """A full ring doubles up to the limit and keeps timestamps in order"""
+        ring = _TimestampRing()
+        size = len(ring.slots)
+        for timestamp in range(size):
+            ring.append(timestamp, 100)
+        ring.expire(2)
+        for timestamp in range(size, size + 3):
+            ring.append(timestamp, 100)
+        
+        # Full and wrapped; the next append grows it
+        ring.append(size + 3, 100)
+        assert len(ring.slots) == 2 * size
+        assert list(ring) == list(range(3, size + 4))
+        
+        # Growth stops at the limit
+        for timestamp in range(size + 4, 100 + 3):
+            ring.append(timestamp, 100)
+        assert len(ring) == 100
+        assert len(ring.slots) == 100
+        assert list(ring) == list(range(3, 103))
+
 class TestAdvancedRateLimiter:
     """Test the advanced rate limiter functionality"""
     
@@ -281,19 +343,33 @@ def run_performance_test():
     request.headers = {}
     
     # Test performance
-    start_time = time.time()
     iterations = 1000
+    batch_size = 64
+    latencies = []
+    
+    async def timed_check():
+        started = time.perf_counter()
+        await rate_limiter.check_rate_limits(request)
+        latencies.append(time.perf_counter() - started)
     
-    for _ in range(iterations):
-        asyncio.run(rate_limiter.check_rate_limits(request))
+    async def driver():
+        # One event loop for the whole run so the timing measures the
+        # rate limiter rather than loop setup and teardown; checks go out
+        # in concurrent waves, as they arrive from a busy server
+        for offset in range(0, iterations, batch_size):
+            wave = min(batch_size, iterations - offset)
+            await asyncio.gather(*(timed_check() for _ in range(wave)))
     
-    end_time = time.time()
+    start_time = time.perf_counter()
+    asyncio.run(driver())
+    end_time = time.perf_counter()
     duration = end_time - start_time
     rate = iterations / duration
+    p50, p95, p99 = (statistics.quantiles(latencies, n=100)[i] * 1000 for i in (49, 94, 98))
     
-    print(f"Processed {iterations} requests in {duration:.2f}s")
+    print(f"Processed {iterations} requests in {duration:.2f}s ({batch_size} concurrent)")
     print(f"Rate: {rate:.2f} requests/second")
-    print(f"Average latency: {(duration/iterations)*1000:.2f}ms per request")
+    print(f"Latency: p50 {p50:.2f}ms, p95 {p95:.2f}ms, p99 {p99:.2f}ms per request")
 
 def run_redis_connection_test():
     """Test Redis connection"""
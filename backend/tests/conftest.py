@@ -4,7 +4,7 @@ Common setup for all tests.
 """
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -19,12 +19,12 @@ except ImportError:
     Base = None
 
 # Test database URL (in-memory SQLite)
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_engine():
-    """Create test database engine."""
+    """Create the test database engine and schema once per run."""
     if Base is None:
         pytest.skip("Database models not implemented yet")
 
@@ -33,29 +33,57 @@ def test_engine():
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite opens transactions on its own and breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN so per-test rollbacks work
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
-    return engine
+    # StaticPool keeps the single in-memory database alive for the run
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
 def test_db_session(test_engine):
-    """Create test database session."""
+    """Create a test database session rolled back after each test."""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    # Commits from the code under test only release a savepoint, so the
+    # outer transaction still undoes everything the test wrote
     TestingSessionLocal = sessionmaker(
-        autocommit=False, autoflush=False, bind=test_engine
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
     )
     session = TestingSessionLocal()
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture
-def client(test_db_session):
-    """Create test client with dependency override."""
+@pytest.fixture(scope="session")
+def session_client():
+    """Create the test client once per run."""
     if app is None:
         pytest.skip("FastAPI app not implemented yet")
 
+    return TestClient(app)
+
+
+@pytest.fixture
+def client(session_client, test_db_session):
+    """Create test client with dependency override."""
     def override_get_db():
         try:
             yield test_db_session
@@ -63,8 +91,7 @@ def client(test_db_session):
             test_db_session.close()
 
     app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
+    yield session_client
     app.dependency_overrides.clear()
 
 
@@ -0,0 +1,69 @@
+"""
+Unit tests for the Celery result codecs.
+
+Covers the orjson and orjson-zstd serializers registered by tasks.config:
+round trips on both sides of the compression threshold, reading payloads
+written by the plain orjson codec, and datetime encoding.
+"""
+
+from datetime import datetime
+
+from kombu.serialization import dumps, loads
+
+from src.tasks.config import (
+    _ZSTD_MAGIC,
+    _ZSTD_MIN_SIZE,
+    _orjson_dumps,
+    _orjson_zstd_dumps,
+    _orjson_zstd_loads,
+)
+
+
+class TestOrjsonZstdCodec:
+    """Test the orjson-zstd result codec."""
+    
+    def test_small_payload_is_not_compressed(self):
+        """Payloads under the threshold are stored as plain orjson."""
+        meta = {"status": "PENDING", "result": None}
+        data = _orjson_zstd_dumps(meta)
+        
+        assert len(data) < _ZSTD_MIN_SIZE
+        assert not data.startswith(_ZSTD_MAGIC)
+        assert _orjson_zstd_loads(data) == meta
+    
+    def test_large_payload_round_trip(self):
+        """Payloads over the threshold are compressed and decode unchanged."""
+        meta = {
+            "status": "SUCCESS",
+            "result": {"chapters": [{"title": f"Chapter {i}", "sequence": i} for i in range(50)]},
+        }
+        data = _orjson_zstd_dumps(meta)
+        
+        assert data.startswith(_ZSTD_MAGIC)
+        assert len(data) < len(_orjson_dumps(meta))
+        assert _orjson_zstd_loads(data) == meta
+    
+    def test_reads_plain_orjson_payloads(self):
+        """Results stored by the orjson codec still decode."""
+        meta = {
+            "status": "SUCCESS",
+            "result": {"summary": "x" * (2 * _ZSTD_MIN_SIZE)},
+        }
+        
+        assert _orjson_zstd_loads(_orjson_dumps(meta)) == meta
+    
+    def test_datetimes_decode_as_iso_strings(self):
+        """Naive datetimes are written as UTC ISO 8601 strings."""
+        started = datetime(2024, 1, 1, 12, 30, 0)
+        
+        decoded = _orjson_zstd_loads(_orjson_zstd_dumps({"start_time": started}))
+        
+        assert decoded == {"start_time": "2024-01-01T12:30:00+00:00"}
+    
+    def test_registered_with_kombu(self):
+        """The codec is registered under its serializer name."""
+        meta = {"status": "SUCCESS", "result": {"summary": "x" * (2 * _ZSTD_MIN_SIZE)}}
+        content_type, content_encoding, data = dumps(meta, serializer="orjson-zstd")
+        
+        assert content_type == "application/x-orjson-zstd"
+        assert loads(data, content_type, content_encoding) == meta